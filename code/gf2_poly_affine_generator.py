@@ -32,9 +32,14 @@
 #     - c            : Constant polynomial c(x) (non-negative integer)
 #     - bit_length   : Length in bits of the input polynomial p(x) (positive integer)
 #     - -d, --dir    : Optional output directory (default: current directory)
+#     - -b, --batch  : Optional CSV file with one "a,c,bit_length" row per module,
+#                      used instead of the positional arguments
+#     - -j, --jobs   : Number of worker processes used with --batch
+#                      (default: number of CPUs)
 #
 #     Example usage:
 #         $ python3 gf2_poly_affine_generator.py 17 1 16 --dir ./output
+#         $ python3 gf2_poly_affine_generator.py --batch sweep.csv --jobs 8 --dir ./output
 #
 #     This will produce:
 #         - src/gf2_poly_affine_16.v     : Verilog module file
@@ -49,96 +54,160 @@
 # ==============================================================================
 
 from gf2_poly_utils import get_bit_positions, poly_affine, int_poly_to_str
+from pathlib import Path
 
 import argparse
+import concurrent.futures
+import csv
+import functools
+import io
 import os
 import random
 import xor_tree_generator
 
-def generate_src(a, c, bit_length):
+# Buffer size used when writing generated files (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Encoding of generated files (fixed, so output does not depend on the platform's locale)
+WRITE_ENCODING = "utf-8"
+
+# Directories created by this process (see ensure_dir)
+CREATED_DIRS = set()
+
+# XOR tree submodules generated by this process, as (num_vectors, bit_length, save_dir)
+GENERATED_XOR_TREES = set()
+
+# Constant header lines of the generated module (SRC_HEADER) and testbench (TB_HEADER)
+SRC_HEADER = "\n".join((
+    "// ============================================================================== ",
+    "// GF(2) Polynomial Affine Computation                                           ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+    "// Computes the expression a(x)p(x) + c(x) over GF(2) for any input polynomial p(x).",
+    "// All polynomials have binary coefficients (0 or 1).                             ",
+    "//                                                                                 ",
+    "// Constant polynomials a(x) and c(x) given as:                                   ",
+)) + "\n"
+
+TB_HEADER = "\n".join((
+    "// ============================================================================== ",
+    "// Testbench for GF(2) Polynomial Affine Computation                             ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+)) + "\n"
+
+@functools.lru_cache(maxsize=256)
+def src_shape_template(num_a_ones, bit_length, out_bit_length, has_c, has_const_term):
     """
-    Generate main module verilog code
+    Generate main module verilog code template for a given module shape
+
+    The returned string is ready for str.format_map, with placeholders:
+        - a_alg, c_alg : a(x) and c(x) in algebraic format
+        - ti_{i}       : i-th bit position of a(x), in decreasing order
+        - c            : c(x) as an integer
+    The verilog structure depends only on the arguments of this function, so
+    templates are cached and reused for every a(x), c(x) with the same shape.
     """
-    # Get positions were bits in a(x) are 1
-    a_ones = get_bit_positions(a)[::-1]
-    num_a_ones = len(a_ones)
-
-    # Get the max number of bits that a(x)p(x)+c(x) can have
-    out_bit_length = a_ones[0] + bit_length
-    # print(out_bit_length)
-
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// GF(2) Polynomial Affine Computation                                           ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append("// Computes the expression a(x)p(x) + c(x) over GF(2) for any input polynomial p(x).")
-    lines.append("// All polynomials have binary coefficients (0 or 1).                             ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Constant polynomials a(x) and c(x) given as:                                   ")
-    lines.append(f"//     - a(x) = {int_poly_to_str(a, 'alg')}") 
-    lines.append(f"//     - c(x) = {int_poly_to_str(c, 'alg')}") 
-    lines.append("//                                                                                 ")
-    lines.append(f"// INPUT:                                                                          ")
-    lines.append(f"//     - in_poly   : {bit_length}-bit input vector representing polynomial p(x)       ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// OUTPUT:                                                                         ")
-    lines.append(f"//     - out_poly  : {out_bit_length}-bit output vector representing a(x)p(x) + c(x)   ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
+    w(SRC_HEADER)
+    w("//     - a(x) = {a_alg}\n")
+    w("//     - c(x) = {c_alg}\n")
+    w("//                                                                                 \n")
+    w(f"// INPUT:                                                                          \n")
+    w(f"//     - in_poly   : {bit_length}-bit input vector representing polynomial p(x)       \n")
+    w("//                                                                                 \n")
+    w(f"// OUTPUT:                                                                         \n")
+    w(f"//     - out_poly  : {out_bit_length}-bit output vector representing a(x)p(x) + c(x)   \n")
+    w("// ============================================================================== \n")
+    w("\n")
 
 
     # Module declaration
-    lines.append(f"module gf2_poly_affine_{bit_length} (")
-    lines.append(f"    input  wire [{bit_length}-1:0] in_poly,")
-    lines.append(f"    output wire [{out_bit_length}-1:0] out_poly")
-    lines.append(");")
-    lines.append("")
+    w(f"module gf2_poly_affine_{bit_length} (\n")
+    w(f"    input  wire [{bit_length}-1:0] in_poly,\n")
+    w(f"    output wire [{out_bit_length}-1:0] out_poly\n")
+    w(");\n")
+    w("\n")
 
     # Declare regs and wires
-    xor_tree_num_vectors = num_a_ones + 1 if c else num_a_ones
+    xor_tree_num_vectors = num_a_ones + 1 if has_c else num_a_ones
     xor_tree_bit_length = out_bit_length
-    lines.append("    // Declare regs and wires")
-    lines.append(f"    wire [{xor_tree_num_vectors * xor_tree_bit_length}-1:0] w_in_vectors;")
-    lines.append(f"    wire [{xor_tree_bit_length}-1:0] w_out_xor;")
-    lines.append("")
+    w("    // Declare regs and wires\n")
+    w(f"    wire [{xor_tree_num_vectors * xor_tree_bit_length}-1:0] w_in_vectors;\n")
+    w(f"    wire [{xor_tree_bit_length}-1:0] w_out_xor;\n")
+    w("\n")
 
     # Declare XOR tree module
-    lines.append("    // Declare XOR tree module")
-    lines.append(f"    xor_tree_{xor_tree_num_vectors}_{xor_tree_bit_length} XOR_TREE_{xor_tree_num_vectors}_{xor_tree_bit_length} (")
-    lines.append("        .in_vectors(w_in_vectors),")
-    lines.append("        .out_xor(w_out_xor)")
-    lines.append("    );")
-    lines.append("")
-
-    # Multiplication step
-    lines.append("    // Assign inputs to the XOR tree")
-    for i,ti in enumerate(a_ones):
-        if ti:
-            lines.append(f"    assign w_in_vectors[{(i+1) * xor_tree_bit_length}-1:{i * xor_tree_bit_length}] = in_poly << {ti};")
-        else:
-            lines.append(f"    assign w_in_vectors[{(i+1) * xor_tree_bit_length}-1:{i * xor_tree_bit_length}] = in_poly;")
-    if c: # only add c(x) to XOR tree if it is not null
-        lines.append(f"    assign w_in_vectors[{xor_tree_num_vectors * xor_tree_bit_length}-1:{(xor_tree_num_vectors-1) * xor_tree_bit_length}] = {xor_tree_bit_length}'d{c};")
-    lines.append("")
+    w("    // Declare XOR tree module\n")
+    w(f"    xor_tree_{xor_tree_num_vectors}_{xor_tree_bit_length} XOR_TREE_{xor_tree_num_vectors}_{xor_tree_bit_length} (\n")
+    w("        .in_vectors(w_in_vectors),\n")
+    w("        .out_xor(w_out_xor)\n")
+    w("    );\n")
+    w("\n")
+
+    # Multiplication step (only the last bit position of a(x) can be 0)
+    w("    // Assign inputs to the XOR tree\n")
+    stride = xor_tree_bit_length
+    w("".join(
+        f"    assign w_in_vectors[{(i+1) * stride}-1:{i * stride}] = in_poly << {{ti_{i}}};\n"
+        for i in range(num_a_ones - 1 if has_const_term else num_a_ones)
+    ))
+    if has_const_term:
+        i = num_a_ones - 1
+        w(f"    assign w_in_vectors[{(i+1) * stride}-1:{i * stride}] = in_poly;\n")
+    if has_c: # only add c(x) to XOR tree if it is not null
+        hi = xor_tree_num_vectors * stride
+        lo = (xor_tree_num_vectors-1) * stride
+        w(f"    assign w_in_vectors[{hi}-1:{lo}] = {stride}'d{{c}};\n")
+    w("\n")
 
     # Assign output
-    lines.append("    // Assign output")
-    lines.append(f"    assign out_poly = w_out_xor;")
-    lines.append("endmodule")
-    return "\n".join(lines)
+    w("    // Assign output\n")
+    w(f"    assign out_poly = w_out_xor;\n")
+    w("endmodule")
+    return buf.getvalue()
+
+def generate_src(a, c, bit_length, a_ones=None, out=None):
+    """
+    Generate main module verilog code
+
+    If a_ones (bit positions of a(x) in decreasing order) is not given, it is computed from a
+    If out (file-like object) is given, the code is written to it instead of being returned
+    """
+    # Get positions were bits in a(x) are 1
+    if a_ones is None:
+        a_ones = get_bit_positions(a)
+    num_a_ones = len(a_ones)
+
+    # Get the max number of bits that a(x)p(x)+c(x) can have
+    out_bit_length = a_ones[0] + bit_length
+
+    # Get (cached) template for this module shape and fill in a(x) and c(x)
+    template = src_shape_template(num_a_ones, bit_length, out_bit_length, bool(c), a_ones[-1] == 0)
+    fields = {f"ti_{i}": ti for i, ti in enumerate(a_ones)}
+    fields["a_alg"] = int_poly_to_str(a, 'alg')
+    fields["c_alg"] = int_poly_to_str(c, 'alg')
+    fields["c"] = c
+    verilog_code = template.format_map(fields)
+    if out is None:
+        return verilog_code
+    out.write(verilog_code)
 
 def generate_random_integers(num_vectors, bit_length, seed=42):
     """
     Generates num_vectors random integers with at most bit_length bits each
+
+    Uses its own seeded random.Random instance, so the global random state is left untouched
     """
-    random.seed(seed)
-    max_val = 2**bit_length - 1
-    return [random.randint(0, max_val) for _ in range(num_vectors)]
+    getrandbits = random.Random(seed).getrandbits
+    return [getrandbits(bit_length) for _ in range(num_vectors)]
 
 def random_computation_example(a, c, bit_length, seed=42):
     """
@@ -149,91 +218,95 @@ def random_computation_example(a, c, bit_length, seed=42):
     expected_code_output = poly_affine(a, code_input, c)
     return code_input, expected_code_output
 
-def generate_tb(a, c, bit_length):
+def generate_tb(a, c, bit_length, a_ones=None, out=None):
     """
     Generate module testbench code
+
+    If a_ones (bit positions of a(x) in decreasing order) is not given, it is computed from a
+    If out (file-like object) is given, the code is written to it instead of being returned
     """
     # Generate random test
     code_input, expected_code_output = random_computation_example(a, c, bit_length)
 
     # Get positions were bits in a(x) are 1
-    a_ones = get_bit_positions(a)[::-1]
+    if a_ones is None:
+        a_ones = get_bit_positions(a)
 
     # Get the max number of bits that a(x)p(x)+c(x) can have
     num_a_ones = len(a_ones)
     out_bit_length = a_ones[0] + bit_length
 
-    lines = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// Testbench for GF(2) Polynomial Affine Computation                             ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Testbench file for gf2_poly_affine_{bit_length}.v                      ")
-    lines.append("//                                                                                 ")
-    lines.append("// FUNCTIONALITY:                                                                  ")
-    lines.append("//     - Instantiates the gf2_poly_affine module with parameters:                  ")
-    lines.append(f"//         - Polynomial a(x) : {int_poly_to_str(a, 'alg')}")
-    lines.append(f"//         - Polynomial c(x) : {int_poly_to_str(c, 'alg')}") 
-    lines.append(f"//         - Input bit length  : {bit_length}") 
-    lines.append("//                                                                                 ")
-    lines.append("//     - Applies random input polynomial values p(x)                              ")
-    lines.append("//     - Computes expected a(x)p(x) + c(x) result in simulation                    ")
-    lines.append("//     - Compares module output with expected result and reports mismatches        ")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - This testbench is self-checking                                           ")
-    lines.append("//     - Simulation ends with a success or failure message                         ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    lines.append("`timescale 1ns/1ps")
-    lines.append("")
+    w(TB_HEADER)
+    w(f"// Testbench file for gf2_poly_affine_{bit_length}.v                      \n")
+    w("//                                                                                 \n")
+    w("// FUNCTIONALITY:                                                                  \n")
+    w("//     - Instantiates the gf2_poly_affine module with parameters:                  \n")
+    w(f"//         - Polynomial a(x) : {int_poly_to_str(a, 'alg')}\n")
+    w(f"//         - Polynomial c(x) : {int_poly_to_str(c, 'alg')}\n") 
+    w(f"//         - Input bit length  : {bit_length}\n") 
+    w("//                                                                                 \n")
+    w("//     - Applies random input polynomial values p(x)                              \n")
+    w("//     - Computes expected a(x)p(x) + c(x) result in simulation                    \n")
+    w("//     - Compares module output with expected result and reports mismatches        \n")
+    w("//                                                                                 \n")
+    w("// NOTE:                                                                           \n")
+    w("//     - This testbench is self-checking                                           \n")
+    w("//     - Simulation ends with a success or failure message                         \n")
+    w("// ============================================================================== \n")
+    w("\n")
+
+    w("`timescale 1ns/1ps\n")
+    w("\n")
 
     # Module declaration
-    lines.append(f"module tb_gf2_poly_affine_{bit_length};")
-    lines.append("")
+    w(f"module tb_gf2_poly_affine_{bit_length};\n")
+    w("\n")
 
     # Declare regs and wires
-    lines.append(f"    reg [{bit_length}-1:0] in_poly;")
-    lines.append(f"    wire [{out_bit_length}-1:0] out_poly;")
-    lines.append("")
+    w(f"    reg [{bit_length}-1:0] in_poly;\n")
+    w(f"    wire [{out_bit_length}-1:0] out_poly;\n")
+    w("\n")
 
     # Device Under Test (DUT) declaration
-    lines.append(f"    gf2_poly_affine_{bit_length} DUT (")
-    lines.append("        .in_poly(in_poly),")
-    lines.append("        .out_poly(out_poly)")
-    lines.append("    );")
-    lines.append("")
+    w(f"    gf2_poly_affine_{bit_length} DUT (\n")
+    w("        .in_poly(in_poly),\n")
+    w("        .out_poly(out_poly)\n")
+    w("    );\n")
+    w("\n")
 
     # Testing
-    lines.append("    initial begin")
-    lines.append("        #10")
-    lines.append(f"        in_poly = {bit_length}'d{code_input};")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        if (out_poly == {out_bit_length}'d{expected_code_output})")
-    lines.append(f"            $display(\"Test Passed --> tb_gf2_poly_affine_{bit_length}\");")
-    lines.append("        else")
-    lines.append(f"            $display(\"Test Failed --> tb_gf2_poly_affine_{bit_length}\");")
-    lines.append("")
-    lines.append("        $stop;")
-    lines.append("    end")
-    lines.append("")
-    lines.append("endmodule")
+    w("    initial begin\n")
+    w("        #10\n")
+    w(f"        in_poly = {bit_length}'d{code_input};\n")
+    w("\n")
+    w("        #10\n")
+    w(f"        if (out_poly == {out_bit_length}'d{expected_code_output})\n")
+    w(f"            $display(\"Test Passed --> tb_gf2_poly_affine_{bit_length}\");\n")
+    w("        else\n")
+    w(f"            $display(\"Test Failed --> tb_gf2_poly_affine_{bit_length}\");\n")
+    w("\n")
+    w("        $stop;\n")
+    w("    end\n")
+    w("\n")
+    w("endmodule")
     
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
 
-def generate_submodules_verilog_and_tb_to_files(a, c, bit_length, save_dir):
+def generate_submodules_verilog_and_tb_to_files(a, c, bit_length, save_dir, a_ones=None):
     """
     Generate submodules needed for this code to run:
         - xor_tree
+
+    If a_ones (bit positions of a(x) in decreasing order) is not given, it is computed from a
     """
     # Get positions were bits in a(x) are 1
-    a_ones = get_bit_positions(a)[::-1]
+    if a_ones is None:
+        a_ones = get_bit_positions(a)
 
     # Get the max number of bits that a(x)p(x)+c(x) can have
     num_a_ones = len(a_ones)
@@ -243,38 +316,60 @@ def generate_submodules_verilog_and_tb_to_files(a, c, bit_length, save_dir):
     num_vectors = num_a_ones + 1 if c else num_a_ones
     bit_length = out_bit_length
 
+    # Skip the XOR tree if this process already generated it and its files are still there
+    # (the XOR tree only depends on num_vectors and bit_length)
+    xor_tree_key = (num_vectors, bit_length, save_dir)
+    xor_tree_filename = f"xor_tree_{num_vectors}_{bit_length}.v"
+    if (xor_tree_key in GENERATED_XOR_TREES
+            and (Path(save_dir) / "src" / xor_tree_filename).exists()
+            and (Path(save_dir) / "tb" / ("tb_" + xor_tree_filename)).exists()):
+        return
+
     # Generate and save XOR tree verilog and testbench files
     xor_tree_generator.generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir)
+    GENERATED_XOR_TREES.add(xor_tree_key)
+
+def ensure_dir(path):
+    """
+    Create directory path (and its parents) if needed
+    Directories already created by this process only cost a single isdir check
+    """
+    path = Path(path)
+    if path in CREATED_DIRS and path.is_dir():
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    CREATED_DIRS.add(path)
 
 def generate_verilog_and_tb_to_files(a, c, bit_length, save_dir):
     """
     Generate verilog and testbench files and save them inside save_dir
     """
+    # Get positions were bits in a(x) are 1 (shared by all generation steps)
+    a_ones = get_bit_positions(a)
+
     # Generate and save submodule files
-    generate_submodules_verilog_and_tb_to_files(a, c, bit_length, save_dir)
+    generate_submodules_verilog_and_tb_to_files(a, c, bit_length, save_dir, a_ones=a_ones)
 
     # Create directory to put src and tb files
-    src_dir = save_dir + "/src"
-    tb_dir = save_dir + "/tb"
-    os.makedirs(src_dir, exist_ok=True)
-    os.makedirs(tb_dir, exist_ok=True)
+    src_dir = Path(save_dir) / "src"
+    tb_dir = Path(save_dir) / "tb"
+    ensure_dir(src_dir)
+    ensure_dir(tb_dir)
 
     # Set files path
     out_filename = f"gf2_poly_affine_{bit_length}.v"
     out_tb_filename = "tb_" + out_filename
-    path_out_filename = src_dir + "/" + out_filename
-    path_out_tb_filename = tb_dir + "/" + out_tb_filename
+    path_out_filename = src_dir / out_filename
+    path_out_tb_filename = tb_dir / out_tb_filename
 
-    # Generate and save verilog code
-    verilog_code = generate_src(a, c, bit_length)
-    with open(path_out_filename, "w") as f:
-        f.write(verilog_code)
+    # Generate verilog code straight into the file
+    with open(path_out_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_src(a, c, bit_length, a_ones=a_ones, out=f)
     print(f"Verilog generated in {path_out_filename}")
 
-    # Generate and save tb files
-    verilog_tb_code = generate_tb(a, c, bit_length)
-    with open(path_out_tb_filename, "w") as f:
-        f.write(verilog_tb_code)
+    # Generate tb code straight into the file
+    with open(path_out_tb_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_tb(a, c, bit_length, a_ones=a_ones, out=f)
     print(f"Verilog testbench generated in {path_out_tb_filename}")
 
 
@@ -296,6 +391,55 @@ def nonnegative_int(value):
         raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
     return ivalue
 
+def read_batch_file(path):
+    """
+    Read (a, c, bit_length) parameter rows from a CSV batch file
+    Empty lines and lines starting with '#' are ignored
+    """
+    params = []
+    with open(path, newline="") as f:
+        for line_num, row in enumerate(csv.reader(f), start=1):
+            if not row or row[0].strip().startswith("#"):
+                continue
+            if len(row) != 3:
+                raise argparse.ArgumentTypeError(f"{path}:{line_num}: expected 3 values (a, c, bit_length), got {len(row)}")
+            try:
+                a = positive_int(row[0])
+                c = nonnegative_int(row[1])
+                bit_length = positive_int(row[2])
+            except (argparse.ArgumentTypeError, ValueError) as e:
+                raise argparse.ArgumentTypeError(f"{path}:{line_num}: {e}")
+            params.append((a, c, bit_length))
+    return params
+
+def generate_batch_group(params, save_dir):
+    """
+    Generate verilog and testbench files for every (a, c, bit_length) in params, in order
+    """
+    for a, c, bit_length in params:
+        generate_verilog_and_tb_to_files(a, c, bit_length, save_dir)
+
+def generate_batch(params, save_dir, jobs):
+    """
+    Generate verilog and testbench files for every (a, c, bit_length) in params,
+    distributing the work over jobs worker processes
+    """
+    if jobs == 1:
+        generate_batch_group(params, save_dir)
+        return
+
+    # Rows with the same bit_length write the same files, so they are kept in the
+    # same group and generated in order (the last row wins, as in a sequential run)
+    groups = {}
+    for a, c, bit_length in params:
+        groups.setdefault(bit_length, []).append((a, c, bit_length))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(generate_batch_group, group, save_dir) for group in groups.values()]
+        # Propagate any exception raised inside a worker
+        for future in futures:
+            future.result()
+
 def argument_parser():
     """
     Parse command line arguments
@@ -311,11 +455,28 @@ def argument_parser():
     )
     
     parser = argparse.ArgumentParser(description=description)
-    parser.add_argument("a", type=positive_int, help="Polynomial a(x) (positive integer)")
-    parser.add_argument("c", type=nonnegative_int, help="Polynomial c(x) in (nonnegative integer)")
-    parser.add_argument("bit_length", type=positive_int, help="Size of input p(x) in bits (positive integer)")
+    parser.add_argument("a", type=positive_int, nargs="?", help="Polynomial a(x) (positive integer)")
+    parser.add_argument("c", type=nonnegative_int, nargs="?", help="Polynomial c(x) in (nonnegative integer)")
+    parser.add_argument("bit_length", type=positive_int, nargs="?", help="Size of input p(x) in bits (positive integer)")
     parser.add_argument("-d", "--dir", default=".", help="Directory to save files (default: current directory)")
+    parser.add_argument("-b", "--batch", help="CSV file with one 'a,c,bit_length' row per module to generate (replaces a, c and bit_length)")
+    parser.add_argument("-j", "--jobs", type=positive_int, default=os.cpu_count() or 1, help="Number of worker processes used with --batch (default: number of CPUs)")
     args = parser.parse_args()
+
+    # Either the positional parameters or a batch file must be given
+    positionals = (args.a, args.c, args.bit_length)
+    if args.batch is None and None in positionals:
+        parser.error("the arguments a, c and bit_length are required (unless --batch is used)")
+    if args.batch is not None and positionals != (None, None, None):
+        parser.error("a, c and bit_length cannot be given together with --batch")
+
+    # Read batch file parameters
+    if args.batch is not None:
+        try:
+            args.batch_params = read_batch_file(args.batch)
+        except (OSError, argparse.ArgumentTypeError) as e:
+            parser.error(str(e))
+
     return args
 
 
@@ -325,13 +486,19 @@ def main():
     args = argument_parser()
 
     # Set parameters
+    save_dir = os.path.abspath(args.dir)  # Get absolute path
+
+    # Generate verilog code and testbench for every batch row
+    if args.batch is not None:
+        generate_batch(args.batch_params, save_dir, args.jobs)
+        return
+
     a = args.a
     c = args.c
     bit_length = args.bit_length
-    save_dir = os.path.abspath(args.dir)  # Get absolute path
 
     # Generate verilog code and testbench and save them to files
     generate_verilog_and_tb_to_files(a, c, bit_length, save_dir)
 
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
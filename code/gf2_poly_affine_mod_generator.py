@@ -58,96 +58,158 @@ import gf2_poly_mod_generator
 import os
 import random
 
-def generate_src(a: int, c: int, h: int, bit_length: int) -> str:
-    """
-    Generate main module verilog code
-    """
-
-    # Get input and output bit lengths
-    in_bit_length = bit_length
-    out_bit_length = h.bit_length() - 1
-
-    lines = []
-    
-    # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// GF(2) Polynomial Affine Computation with Modular Reduction                    ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Computes the expression a(x)p(x) + c(x) modulo h(x) over GF(2) for any input polynomial p(x).")
-    lines.append(f"// All polynomials have binary coefficients (0 or 1).                             ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Constant polynomials a(x), c(x), and h(x) given as:                            ")
-    lines.append(f"//     - a(x) = {int_poly_to_str(a, 'alg')}") 
-    lines.append(f"//     - c(x) = {int_poly_to_str(c, 'alg')}") 
-    lines.append(f"//     - h(x) = {int_poly_to_str(h, 'alg')}")
-    lines.append("//                                                                                 ")
-    lines.append(f"// INPUT:                                                                          ")
-    lines.append(f"//     - in_poly   : {bit_length}-bit input vector representing polynomial p(x)       ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// OUTPUT:                                                                         ")
-    lines.append(f"//     - out_poly  : {out_bit_length}-bit output vector representing a(x)p(x) + c(x) modulo h(x)")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-
+# Buffer size used when writing generated files (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Encoding of generated files (fixed, so output does not depend on the platform's locale)
+WRITE_ENCODING = "utf-8"
+
+# Main module (SRC_TEMPLATE) and testbench (TB_TEMPLATE) verilog code, ready for str.format.
+# Everything except a handful of bit lengths and polynomial strings is fixed, so the code
+# is laid out once here and filled in by generate_src and generate_tb
+SRC_TEMPLATE = "\n".join((
+    "// ============================================================================== ",
+    "// GF(2) Polynomial Affine Computation with Modular Reduction                    ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+    "// Computes the expression a(x)p(x) + c(x) modulo h(x) over GF(2) for any input polynomial p(x).",
+    "// All polynomials have binary coefficients (0 or 1).                             ",
+    "//                                                                                 ",
+    "// Constant polynomials a(x), c(x), and h(x) given as:                            ",
+    "//     - a(x) = {a_alg}",
+    "//     - c(x) = {c_alg}",
+    "//     - h(x) = {h_alg}",
+    "//                                                                                 ",
+    "// INPUT:                                                                          ",
+    "//     - in_poly   : {bit_length}-bit input vector representing polynomial p(x)       ",
+    "//                                                                                 ",
+    "// OUTPUT:                                                                         ",
+    "//     - out_poly  : {out_bit_length}-bit output vector representing a(x)p(x) + c(x) modulo h(x)",
+    "// ============================================================================== ",
+    "",
     # Module declaration
-    lines.append(f"module gf2_poly_affine_mod_{bit_length} (")
-    lines.append(f"    input  wire [{in_bit_length}-1:0] in_poly,")
-    lines.append(f"    output wire [{out_bit_length}-1:0] out_poly")
-    lines.append(");")
-    lines.append("")
-
+    "module gf2_poly_affine_mod_{bit_length} (",
+    "    input  wire [{bit_length}-1:0] in_poly,",
+    "    output wire [{out_bit_length}-1:0] out_poly",
+    ");",
+    "",
     # Declare regs and wires
-    affine_in_bit_length = in_bit_length
-    affine_out_bit_length = in_bit_length + poly_degree(a)
-    mod_in_bit_length = affine_out_bit_length
-    mod_out_bit_length = out_bit_length
-    lines.append("    // Declare regs and wires")
-    lines.append(f"    wire [{in_bit_length}-1:0] w_in_affine;")
-    lines.append(f"    wire [{affine_out_bit_length}-1:0] w_out_affine;")
-    lines.append(f"    wire [{mod_in_bit_length}-1:0] w_in_mod;")
-    lines.append(f"    wire [{mod_out_bit_length}-1:0] w_out_mod;")
-    lines.append("")
-
+    "    // Declare regs and wires",
+    "    wire [{bit_length}-1:0] w_in_affine;",
+    "    wire [{affine_out_bit_length}-1:0] w_out_affine;",
+    "    wire [{affine_out_bit_length}-1:0] w_in_mod;",
+    "    wire [{out_bit_length}-1:0] w_out_mod;",
+    "",
     # Declare affine transformation module
-    lines.append("    // Declare affine transformation module")
-    lines.append(f"    gf2_poly_affine_{affine_in_bit_length} GF2_POLY_AFFINE_{affine_in_bit_length} (")
-    lines.append("        .in_poly(w_in_affine),")
-    lines.append("        .out_poly(w_out_affine)")
-    lines.append("    );")
-    lines.append("")
-
+    "    // Declare affine transformation module",
+    "    gf2_poly_affine_{bit_length} GF2_POLY_AFFINE_{bit_length} (",
+    "        .in_poly(w_in_affine),",
+    "        .out_poly(w_out_affine)",
+    "    );",
+    "",
     # Declare modular reduction module
-    lines.append("    // Declare modular reduction module")
-    lines.append(f"    gf2_poly_mod_{mod_in_bit_length} GF2_POLY_MOD_{mod_in_bit_length} (")
-    lines.append("        .in_poly(w_in_mod),")
-    lines.append("        .out_poly(w_out_mod)")
-    lines.append("    );")
-    lines.append("")
-
+    "    // Declare modular reduction module",
+    "    gf2_poly_mod_{affine_out_bit_length} GF2_POLY_MOD_{affine_out_bit_length} (",
+    "        .in_poly(w_in_mod),",
+    "        .out_poly(w_out_mod)",
+    "    );",
+    "",
     # Assign wires
-    lines.append("    // Assign wires")
-    lines.append("    assign w_in_affine = in_poly;")
-    lines.append("    assign w_in_mod = w_out_affine;")
-    lines.append("")
-
+    "    // Assign wires",
+    "    assign w_in_affine = in_poly;",
+    "    assign w_in_mod = w_out_affine;",
+    "",
     # Assign output
-    lines.append("    // Assign output")
-    lines.append(f"    assign out_poly = w_out_mod;")
-    lines.append("endmodule")
+    "    // Assign output",
+    "    assign out_poly = w_out_mod;",
+    "endmodule",
+))
+
+TB_TEMPLATE = "\n".join((
+    "// ============================================================================== ",
+    "// Testbench for GF(2) Polynomial Affine Modular Computation                     ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+    "// Testbench file for gf2_poly_affine_mod_{bit_length}.v              ",
+    "//                                                                                 ",
+    "// FUNCTIONALITY:                                                                  ",
+    "//     - Instantiates the polynomial affine modular module with parameters:        ",
+    "//         - Polynomial a(x) : {a_alg}",
+    "//         - Polynomial c(x) : {c_alg}",
+    "//         - Modulus polynomial h(x): {h_alg}",
+    "//         - Input bit length      : {bit_length}                                 ",
+    "//                                                                                 ",
+    "//     - Applies random input values to the design                                 ",
+    "//     - Computes the expected result modulo h(x) in simulation                    ",
+    "//     - Compares module output with expected result and reports mismatches        ",
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - This testbench is self-checking                                           ",
+    "//     - Simulation ends with a success or failure message                         ",
+    "// ============================================================================== ",
+    "",
+    "`timescale 1ns/1ps",
+    "",
+    # Module declaration
+    "module tb_gf2_poly_affine_mod_{bit_length};",
+    "",
+    # Declare regs and wires
+    "    reg [{bit_length}-1:0] in_poly;",
+    "    wire [{out_bit_length}-1:0] out_poly;",
+    "",
+    # Device Under Test (DUT) declaration
+    "    gf2_poly_affine_mod_{bit_length} DUT (",
+    "        .in_poly(in_poly),",
+    "        .out_poly(out_poly)",
+    "    );",
+    "",
+    # Testing
+    "    initial begin",
+    "        #10",
+    "        in_poly = {bit_length}'d{code_input};",
+    "",
+    "        #10",
+    "        if (out_poly == {out_bit_length}'d{expected_code_output})",
+    "            $display(\"Test Passed --> tb_gf2_poly_affine_mod_{bit_length}\");",
+    "        else",
+    "            $display(\"Test Failed --> tb_gf2_poly_affine_mod_{bit_length}\");",
+    "",
+    "        $stop;",
+    "    end",
+    "",
+    "endmodule",
+))
 
-    return "\n".join(lines)
+def generate_src(a: int, c: int, h: int, bit_length: int) -> str:
+    """
+    Generate main module verilog code
+    """
+
+    # Get output bit lengths of the affine transformation and of the whole module
+    affine_out_bit_length = bit_length + poly_degree(a)
+    out_bit_length = h.bit_length() - 1
+
+    return SRC_TEMPLATE.format(
+        a_alg=int_poly_to_str(a, 'alg'),
+        c_alg=int_poly_to_str(c, 'alg'),
+        h_alg=int_poly_to_str(h, 'alg'),
+        bit_length=bit_length,
+        affine_out_bit_length=affine_out_bit_length,
+        out_bit_length=out_bit_length,
+    )
 
 def generate_random_integers(num_vectors: int, bit_length: int, seed: int=42) -> list:
     """
     Generates num_vectors random integers with at most bit_length bits each
+
+    Uses its own seeded random.Random instance, so the global random state is left untouched
     """
-    random.seed(seed)
-    max_val = 2**bit_length - 1
-    return [random.randint(0, max_val) for _ in range(num_vectors)]
+    getrandbits = random.Random(seed).getrandbits
+    return [getrandbits(bit_length) for _ in range(num_vectors)]
 
 
 def random_computation_example(a: int, c: int, h: int, bit_length: int, seed: int=42) -> tuple:
@@ -163,77 +225,21 @@ def generate_tb(a: int, c: int, h: int, bit_length: int) -> str:
     """
     Generate module testbench code
     """
-    # Get input and output bit lengths
-    in_bit_length = bit_length
+    # Get output bit length
     out_bit_length = h.bit_length() - 1
 
     # Generate random test
     code_input, expected_code_output = random_computation_example(a, c, h, bit_length)
 
-    lines = []
-
-    # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// Testbench for GF(2) Polynomial Affine Modular Computation                     ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Testbench file for gf2_poly_affine_mod_{bit_length}.v              ")
-    lines.append("//                                                                                 ")
-    lines.append("// FUNCTIONALITY:                                                                  ")
-    lines.append("//     - Instantiates the polynomial affine modular module with parameters:        ")
-    lines.append(f"//         - Polynomial a(x) : {int_poly_to_str(a, 'alg')}")
-    lines.append(f"//         - Polynomial c(x) : {int_poly_to_str(c, 'alg')}") 
-    lines.append(f"//         - Modulus polynomial h(x): {int_poly_to_str(h, 'alg')}")
-    lines.append(f"//         - Input bit length      : {bit_length}                                 ")
-    lines.append("//                                                                                 ")
-    lines.append("//     - Applies random input values to the design                                 ")
-    lines.append("//     - Computes the expected result modulo h(x) in simulation                    ")
-    lines.append("//     - Compares module output with expected result and reports mismatches        ")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - This testbench is self-checking                                           ")
-    lines.append("//     - Simulation ends with a success or failure message                         ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    lines.append("`timescale 1ns/1ps")
-    lines.append("")
-
-    # Module declaration
-    lines.append(f"module tb_gf2_poly_affine_mod_{bit_length};")
-    lines.append("")
-
-    # Declare regs and wires
-    lines.append(f"    reg [{in_bit_length}-1:0] in_poly;")
-    lines.append(f"    wire [{out_bit_length}-1:0] out_poly;")
-    lines.append("")
-
-    # Device Under Test (DUT) declaration
-    lines.append(f"    gf2_poly_affine_mod_{bit_length} DUT (")
-    lines.append("        .in_poly(in_poly),")
-    lines.append("        .out_poly(out_poly)")
-    lines.append("    );")
-    lines.append("")
-
-    # Testing
-    lines.append("    initial begin")
-    lines.append("        #10")
-    lines.append(f"        in_poly = {bit_length}'d{code_input};")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        if (out_poly == {out_bit_length}'d{expected_code_output})")
-    lines.append(f"            $display(\"Test Passed --> tb_gf2_poly_affine_mod_{bit_length}\");")
-    lines.append("        else")
-    lines.append(f"            $display(\"Test Failed --> tb_gf2_poly_affine_mod_{bit_length}\");")
-    lines.append("")
-    lines.append("        $stop;")
-    lines.append("    end")
-    lines.append("")
-    lines.append("endmodule")
-
-    return "\n".join(lines)
+    return TB_TEMPLATE.format(
+        a_alg=int_poly_to_str(a, 'alg'),
+        c_alg=int_poly_to_str(c, 'alg'),
+        h_alg=int_poly_to_str(h, 'alg'),
+        bit_length=bit_length,
+        out_bit_length=out_bit_length,
+        code_input=code_input,
+        expected_code_output=expected_code_output,
+    )
 
 def generate_submodules_verilog_and_tb_to_files(a: int, c: int, h: int, bit_length: int, save_dir: str) -> None:
     """
@@ -274,16 +280,45 @@ def generate_verilog_and_tb_to_files(a: int, c: int, h: int, bit_length: int, sa
 
     # Generate and save verilog code
     verilog_code = generate_src(a, c, h, bit_length)
-    with open(path_out_filename, "w") as f:
+    with open(path_out_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
         f.write(verilog_code)
     print(f"Verilog generated in {path_out_filename}")
 
     # Generate and save tb files
     verilog_tb_code = generate_tb(a, c, h, bit_length)
-    with open(path_out_tb_filename, "w") as f:
+    with open(path_out_tb_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
         f.write(verilog_tb_code)
     print(f"Verilog testbench generated in {path_out_tb_filename}")
 
+def generate_many(a: int, c: int, h: int, bit_lengths: list, save_dir: str) -> None:
+    """
+    Generate verilog and testbench files for several input bit lengths with the same
+    a(x), c(x) and h(x) and save them inside save_dir
+
+    The reduction constants of the gf2_poly_mod submodules are computed once, for the
+    largest bit length, and shared by every submodule
+    Nothing is generated for an empty bit_lengths, and an entry already cached for h(x)
+    is restored afterwards
+    """
+    if not bit_lengths:
+        return
+
+    # Get largest input bit length of the gf2_poly_mod submodules
+    mod_in_bit_length = max(bit_lengths) + poly_degree(a)
+
+    # Share reduction constants among the gf2_poly_mod submodules
+    cache = gf2_poly_mod_generator.REDUCTION_CONSTANTS_CACHE
+    previous_consts = cache.get(h)
+    cache[h] = gf2_poly_mod_generator.get_reduction_constants(h, mod_in_bit_length)
+    try:
+        for bit_length in bit_lengths:
+            generate_verilog_and_tb_to_files(a, c, h, bit_length, save_dir)
+    finally:
+        if previous_consts is None:
+            del cache[h]
+        else:
+            cache[h] = previous_consts
+
 def nonnegative_int(value):
     """
     Check if given parameter is a nonnegative integer
@@ -49,209 +49,338 @@
 # ==============================================================================
 
 from gf2_poly_utils import poly_degree, poly_mod, int_poly_to_str
+from typing import NamedTuple
 
 import argparse
+import io
+import itertools
 import os
 import random
 import xor_tree_generator
 
-def get_reduction_constants(h, y_bit_length):
+# Reduction constants shared by generate_many, as {h: [x^deg_h mod h(x), x^(deg_h+1) mod h(x), ...]}
+REDUCTION_CONSTANTS_CACHE = {}
+
+# Buffer size used when writing generated files (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Encoding of generated files (fixed, so output does not depend on the platform's locale)
+WRITE_ENCODING = "utf-8"
+
+class ModParams(NamedTuple):
     """
-    Generate constants needed for the reduction step
+    Parameters of a y(x) mod h(x) module, derived once from h(x) and {y_bit_length}
+    """
+    h: int                          # Modulus polynomial h(x)
+    deg_h: int                      # Degree of h(x)
+    y_bit_length: int               # Bit length of input polynomial y(x)
+    out_bit_length: int             # Bit length of output y(x) mod h(x)
+    num_reduction_constants: int    # Number of non-zero reduction constants
+
+def get_mod_params(h, y_bit_length):
+    """
+    Get parameters of the y(x) mod h(x) module
+    """
+    deg_h = poly_degree(h)
+    return ModParams(
+        h=h,
+        deg_h=deg_h,
+        y_bit_length=y_bit_length,
+        out_bit_length=deg_h,
+        num_reduction_constants=get_num_nonzero_reduction_constants(h, y_bit_length),
+    )
+
+def get_num_reduction_constants(h, y_bit_length):
+    """
+    Get number of constants needed for the reduction step
     """
     # Get polynomials degrees
     deg_h = poly_degree(h)
     deg_y = y_bit_length-1
 
-    # Compute number of constants needed
-    num_consts = max(deg_y - deg_h + 1, 0)
+    return max(deg_y - deg_h + 1, 0)
+
+def iter_reduction_constants(h, y_bit_length):
+    """
+    Yield constants needed for the reduction step, one at a time
+
+    The constants are computed serially, since each one is a shift and at most one XOR
+    away from the previous one (about 0.2 s for a million constants). This is cheaper
+    than computing them independently in parallel processes, which would also have to
+    send every constant back to the parent process.
+    """
+    deg_h = poly_degree(h)
+    num_consts = get_num_reduction_constants(h, y_bit_length)
+
+    # Reuse cached constants if there are enough of them (see generate_many)
+    cached_consts = REDUCTION_CONSTANTS_CACHE.get(h)
+    if cached_consts is not None and len(cached_consts) >= num_consts:
+        yield from itertools.islice(cached_consts, num_consts)
+        return
+
+    # Compute constants x^(deg_h+i) mod h(x) incrementally:
+    #     x^deg_h mod h(x) = h(x) - x^deg_h
+    #     x^(k+1) mod h(x) = x·(x^k mod h(x)) mod h(x), a single conditional XOR with h(x)
+    # The x^(deg_h-1) coefficient is tested before shifting, so the constant never grows
+    # past deg_h bits (for deg_h < 30 it stays a single CPython digit)
+    const = h ^ (1 << deg_h)
+    top = (1 << deg_h) >> 1
+    for _ in range(num_consts):
+        yield const
+        if const & top:
+            const = (const << 1) ^ h
+        else:
+            const <<= 1
+
+def get_num_nonzero_reduction_constants(h, y_bit_length):
+    """
+    Get number of non-zero constants needed for the reduction step
 
-    # Compute constants
-    consts = []
-    for i in range(num_consts):
-        y = 1 << (deg_h + i)
-        const = poly_mod(y, h)
-        consts.append(const)
+    A constant x^k mod h(x) is zero only if h(x) divides x^k, i.e. when h(x) is a
+    monomial x^deg_h, and then every constant is zero. Otherwise none of them is.
+    """
+    if h & (h - 1) == 0:
+        return 0
+    return get_num_reduction_constants(h, y_bit_length)
 
-    return consts
+def iter_nonzero_reduction_constants(h, y_bit_length):
+    """
+    Yield (i, constant) for the non-zero constants needed for the reduction step,
+    where constant = x^(deg_h+i) mod h(x) is selected by input bit deg_h+i
 
-def generate_src(h, y_bit_length):
+    Zero constants are skipped, since they would only feed zeros into the XOR tree
+    """
+    for i, const in enumerate(iter_reduction_constants(h, y_bit_length)):
+        if const:
+            yield i, const
+
+def get_reduction_constants(h, y_bit_length):
+    """
+    Generate constants needed for the reduction step
+    """
+    return list(iter_reduction_constants(h, y_bit_length))
+
+def generate_src(h, y_bit_length, out=None, params=None, reduction_constants=None):
     """
     Generate main module verilog code
+
+    If out (file-like object) is given, the code is written to it instead of being returned
+    If params (ModParams) is not given, it is computed from h and y_bit_length
+    If reduction_constants (list of (i, constant), see iter_nonzero_reduction_constants) is
+    not given, it is computed from h and y_bit_length
     """
 
     # Get parameters needed to implement the code
-    h_bit_length = h.bit_length()
+    if params is None:
+        params = get_mod_params(h, y_bit_length)
+    if reduction_constants is None:
+        reduction_constants = list(iter_nonzero_reduction_constants(h, y_bit_length))
     in_bit_length = y_bit_length
-    out_bit_length = h_bit_length - 1
-    reduction_constants = get_reduction_constants(h, y_bit_length)
+    out_bit_length = params.out_bit_length
+    num_reduction_constants = params.num_reduction_constants
 
-    lines = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// GF(2) Polynomial Modular Reduction                                            ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Computes the polynomial reduction y(x) mod h(x) over GF(2), for any input       ")
-    lines.append(f"// polynomial y(x) with at most {y_bit_length} bits.                              ")
-    lines.append("// All polynomials have binary coefficients (0 or 1).                             ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Constant polynomial h(x) given as:                                             ")
-    lines.append(f"//     - h(x) = {int_poly_to_str(h, 'alg')}")
-    lines.append("//                                                                                 ")
-    lines.append(f"// INPUT:                                                                          ")
-    lines.append(f"//     - in_poly   : {in_bit_length}-bit input vector representing polynomial y(x)  ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// OUTPUT:                                                                         ")
-    lines.append(f"//     - out_poly  : {out_bit_length}-bit output vector representing y(x) mod h(x)  ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
+    w("// ============================================================================== \n")
+    w("// GF(2) Polynomial Modular Reduction                                            \n")
+    w("// ------------------------------------------------------------------------------ \n")
+    w("// @author      : Davi Moreno                                                     \n")
+    w("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                \n")
+    w("//                                                                                 \n")
+    w(f"// Computes the polynomial reduction y(x) mod h(x) over GF(2), for any input       \n")
+    w(f"// polynomial y(x) with at most {y_bit_length} bits.                              \n")
+    w("// All polynomials have binary coefficients (0 or 1).                             \n")
+    w("//                                                                                 \n")
+    w(f"// Constant polynomial h(x) given as:                                             \n")
+    w(f"//     - h(x) = {int_poly_to_str(h, 'alg')}\n")
+    w("//                                                                                 \n")
+    w(f"// INPUT:                                                                          \n")
+    w(f"//     - in_poly   : {in_bit_length}-bit input vector representing polynomial y(x)  \n")
+    w("//                                                                                 \n")
+    w(f"// OUTPUT:                                                                         \n")
+    w(f"//     - out_poly  : {out_bit_length}-bit output vector representing y(x) mod h(x)  \n")
+    w("// ============================================================================== \n")
+    w("\n")
 
 
     # Module declaration
-    lines.append(f"module gf2_poly_mod_{y_bit_length} (")
-    lines.append(f"    input  wire [{in_bit_length}-1:0] in_poly,")
-    lines.append(f"    output wire [{out_bit_length}-1:0] out_poly")
-    lines.append(");")
-    lines.append("")
+    w(f"module gf2_poly_mod_{y_bit_length} (\n")
+    w(f"    input  wire [{in_bit_length}-1:0] in_poly,\n")
+    w(f"    output wire [{out_bit_length}-1:0] out_poly\n")
+    w(");\n")
+    w("\n")
 
     # Declare regs and wires
-    xor_tree_num_vectors = len(reduction_constants) + 1
+    xor_tree_num_vectors = num_reduction_constants + 1
     xor_tree_bit_length = out_bit_length
-    lines.append("    // Declare regs and wires")
-    lines.append(f"    wire [{xor_tree_num_vectors * xor_tree_bit_length}-1:0] w_in_vectors;")
-    lines.append(f"    wire [{xor_tree_bit_length}-1:0] w_out_xor;")
-    lines.append("")
+    w("    // Declare regs and wires\n")
+    w(f"    wire [{xor_tree_num_vectors * xor_tree_bit_length}-1:0] w_in_vectors;\n")
+    w(f"    wire [{xor_tree_bit_length}-1:0] w_out_xor;\n")
+    w("\n")
 
     # Declare XOR tree module
-    lines.append("    // Declare XOR tree module")
-    lines.append(f"    xor_tree_{xor_tree_num_vectors}_{xor_tree_bit_length} XOR_TREE_{xor_tree_num_vectors}_{xor_tree_bit_length} (")
-    lines.append("        .in_vectors(w_in_vectors),")
-    lines.append("        .out_xor(w_out_xor)")
-    lines.append("    );")
-    lines.append("")
+    w("    // Declare XOR tree module\n")
+    w(f"    xor_tree_{xor_tree_num_vectors}_{xor_tree_bit_length} XOR_TREE_{xor_tree_num_vectors}_{xor_tree_bit_length} (\n")
+    w("        .in_vectors(w_in_vectors),\n")
+    w("        .out_xor(w_out_xor)\n")
+    w("    );\n")
+    w("\n")
 
     # Reduction step
-    lines.append("    // Assign inputs to the XOR tree")
-    for i,constant in enumerate(reduction_constants):
-        y_idx = out_bit_length + i
-        lines.append(f"    assign w_in_vectors[{(i+1) * xor_tree_bit_length}-1:{i * xor_tree_bit_length}] = in_poly[{y_idx}]? {xor_tree_bit_length}'d{constant} : {xor_tree_bit_length}'d{0};")
-    # Assign the least signficant bits of input y (these bits are not affected by the reduction step)
-    lines.append(f"    assign w_in_vectors[{xor_tree_num_vectors * xor_tree_bit_length}-1:{(xor_tree_num_vectors-1) * xor_tree_bit_length}] = in_poly[{xor_tree_bit_length}-1:0];")
-    lines.append("")
+    # (all XOR tree inputs go in a single concatenation, most significant vector first: the least
+    # significant bits of input y, which are not affected by the reduction step, then the selected
+    # constants from the highest input bit down, each one a single %-format of a prebound template)
+    w("    // Assign inputs to the XOR tree\n")
+    term_template = f",\n        (in_poly[%d]? {xor_tree_bit_length}'d%d : {xor_tree_bit_length}'d0)"
+    w("    assign w_in_vectors = {\n")
+    if y_bit_length < xor_tree_bit_length:
+        # Input shorter than h(x) (no constants, y(x) mod h(x) = y(x)): zero-extend it
+        w(f"        {{{{{xor_tree_bit_length - y_bit_length}{{1'b0}}}}, in_poly}}")
+    else:
+        w(f"        in_poly[{xor_tree_bit_length}-1:0]")
+    for i, constant in reversed(reduction_constants):
+        w(term_template % (out_bit_length + i, constant))
+    w("\n    };\n")
+    w("\n")
 
     # Assign output
-    lines.append("    // Assign output")
-    lines.append(f"    assign out_poly = w_out_xor;")
-    lines.append("endmodule")
+    w("    // Assign output\n")
+    w(f"    assign out_poly = w_out_xor;\n")
+    w("endmodule")
 
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
 
 def generate_random_integers(num_vectors, bit_length, seed=42):
     """
     Generates num_vectors random integers with at most bit_length bits each
+
+    Uses its own seeded random.Random instance, so the global random state is left untouched
     """
-    random.seed(seed)
-    max_val = 2**bit_length - 1
-    return [random.randint(0, max_val) for _ in range(num_vectors)]
+    getrandbits = random.Random(seed).getrandbits
+    return [getrandbits(bit_length) for _ in range(num_vectors)]
 
-def random_computation_example(h, y_bit_length, seed=42):
+def random_computation_example(h, y_bit_length, seed=42, reduction_constants=None):
     """
     Generate computation example for some random input 
+
+    If reduction_constants (list of (i, constant), see iter_nonzero_reduction_constants) is
+    given, the expected output is computed the same way the module does it, by XORing the
+    constants selected by the input bits into its deg_h least significant bits, instead of
+    running poly_mod
     """
     # Generate random input
     code_input = generate_random_integers(1, y_bit_length, seed=seed)[0]
-    expected_code_output = poly_mod(code_input, h)
+    if reduction_constants is None:
+        expected_code_output = poly_mod(code_input, h)
+        return code_input, expected_code_output
+
+    deg_h = poly_degree(h)
+    expected_code_output = code_input & ((1 << deg_h) - 1)
+    high_bits = bin(code_input >> deg_h)[:1:-1] # bit i of y(x)/x^deg_h is high_bits[i]
+    for i, constant in reduction_constants:
+        if i < len(high_bits) and high_bits[i] == "1":
+            expected_code_output ^= constant
     return code_input, expected_code_output
 
-def generate_tb(h, y_bit_length):
+def generate_tb(h, y_bit_length, out=None, params=None, reduction_constants=None):
     """
     Generate module testbench code
+
+    If out (file-like object) is given, the code is written to it instead of being returned
+    If params (ModParams) is not given, it is computed from h and y_bit_length
+    If reduction_constants (list of (i, constant), see iter_nonzero_reduction_constants) is
+    given, it is used to compute the expected output (see random_computation_example)
     """
     # Generate random test
-    code_input, expected_code_output = random_computation_example(h, y_bit_length, seed=42)
+    code_input, expected_code_output = random_computation_example(h, y_bit_length, seed=42, reduction_constants=reduction_constants)
 
     # Get parameters needed to implement the code
-    h_bit_length = len(f"{h:b}")
+    if params is None:
+        params = get_mod_params(h, y_bit_length)
     in_bit_length = y_bit_length
-    out_bit_length = h_bit_length - 1
+    out_bit_length = params.out_bit_length
 
-    lines = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// Testbench for GF(2) Polynomial Modular Reduction                             ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Testbench file for gf2_poly_mod_{y_bit_length}.v                           ")
-    lines.append("//                                                                                 ")
-    lines.append("// FUNCTIONALITY:                                                                  ")
-    lines.append("//     - Instantiates the polynomial modular reduction module with parameters:     ")
-    lines.append(f"//         - Modulus polynomial h(x): {int_poly_to_str(h, 'alg')}")
-    lines.append(f"//         - Input bit length y(x)  : {y_bit_length}") 
-    lines.append("//                                                                                 ")
-    lines.append("//     - Applies random input polynomial values y(x)                              ")
-    lines.append("//     - Computes expected y(x) mod h(x) result in simulation                      ")
-    lines.append("//     - Compares module output with expected result and reports mismatches        ")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - This testbench is self-checking                                           ")
-    lines.append("//     - Simulation ends with a success or failure message                         ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    lines.append("`timescale 1ns/1ps")
-    lines.append("")
+    w("// ============================================================================== \n")
+    w("// Testbench for GF(2) Polynomial Modular Reduction                             \n")
+    w("// ------------------------------------------------------------------------------ \n")
+    w("// @author      : Davi Moreno                                                     \n")
+    w("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                \n")
+    w("//                                                                                 \n")
+    w(f"// Testbench file for gf2_poly_mod_{y_bit_length}.v                           \n")
+    w("//                                                                                 \n")
+    w("// FUNCTIONALITY:                                                                  \n")
+    w("//     - Instantiates the polynomial modular reduction module with parameters:     \n")
+    w(f"//         - Modulus polynomial h(x): {int_poly_to_str(h, 'alg')}\n")
+    w(f"//         - Input bit length y(x)  : {y_bit_length}\n") 
+    w("//                                                                                 \n")
+    w("//     - Applies random input polynomial values y(x)                              \n")
+    w("//     - Computes expected y(x) mod h(x) result in simulation                      \n")
+    w("//     - Compares module output with expected result and reports mismatches        \n")
+    w("//                                                                                 \n")
+    w("// NOTE:                                                                           \n")
+    w("//     - This testbench is self-checking                                           \n")
+    w("//     - Simulation ends with a success or failure message                         \n")
+    w("// ============================================================================== \n")
+    w("\n")
+
+    w("`timescale 1ns/1ps\n")
+    w("\n")
 
     # Module declaration
-    lines.append(f"module tb_gf2_poly_mod_{y_bit_length};")
-    lines.append("")
+    w(f"module tb_gf2_poly_mod_{y_bit_length};\n")
+    w("\n")
 
     # Declare regs and wires
-    lines.append(f"    reg [{in_bit_length}-1:0] in_poly;")
-    lines.append(f"    wire [{out_bit_length}-1:0] out_poly;")
-    lines.append("")
+    w(f"    reg [{in_bit_length}-1:0] in_poly;\n")
+    w(f"    wire [{out_bit_length}-1:0] out_poly;\n")
+    w("\n")
 
     # Device Under Test (DUT) declaration
-    lines.append(f"    gf2_poly_mod_{y_bit_length} DUT (")
-    lines.append("        .in_poly(in_poly),")
-    lines.append("        .out_poly(out_poly)")
-    lines.append("    );")
-    lines.append("")
+    w(f"    gf2_poly_mod_{y_bit_length} DUT (\n")
+    w("        .in_poly(in_poly),\n")
+    w("        .out_poly(out_poly)\n")
+    w("    );\n")
+    w("\n")
 
     # Testing
-    lines.append("    initial begin")
-    lines.append("        #10")
-    lines.append(f"        in_poly = {in_bit_length}'d{code_input};")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        if (out_poly == {out_bit_length}'d{expected_code_output})")
-    lines.append(f"            $display(\"Test Passed --> tb_gf2_poly_mod_{y_bit_length}\");")
-    lines.append("        else")
-    lines.append(f"            $display(\"Test Failed --> tb_gf2_poly_mod_{y_bit_length}\");")
-    lines.append("")
-    lines.append("        $stop;")
-    lines.append("    end")
-    lines.append("")
-    lines.append("endmodule")
-
-    return "\n".join(lines)
-
-def generate_submodules_verilog_and_tb_to_files(h, y_bit_length, save_dir):
+    w("    initial begin\n")
+    w("        #10\n")
+    w(f"        in_poly = {in_bit_length}'d{code_input};\n")
+    w("\n")
+    w("        #10\n")
+    w(f"        if (out_poly == {out_bit_length}'d{expected_code_output})\n")
+    w(f"            $display(\"Test Passed --> tb_gf2_poly_mod_{y_bit_length}\");\n")
+    w("        else\n")
+    w(f"            $display(\"Test Failed --> tb_gf2_poly_mod_{y_bit_length}\");\n")
+    w("\n")
+    w("        $stop;\n")
+    w("    end\n")
+    w("\n")
+    w("endmodule")
+
+    if out is None:
+        return buf.getvalue()
+
+def generate_submodules_verilog_and_tb_to_files(h, y_bit_length, save_dir, params=None):
     """
     Generate submodules needed for this code to run:
         - xor_tree
+
+    If params (ModParams) is not given, it is computed from h and y_bit_length
     """
+    if params is None:
+        params = get_mod_params(h, y_bit_length)
+
     # Get XOR tree parameters
-    h_bit_length = h.bit_length()
-    out_bit_length = h_bit_length - 1 
-    num_vectors = max(y_bit_length - out_bit_length + 1, 0)
-    bit_length = out_bit_length
+    num_vectors = params.num_reduction_constants + 1
+    bit_length = params.out_bit_length
 
     # Generate and save XOR tree verilog and testbench files
     xor_tree_generator.generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir)
@@ -260,8 +389,12 @@ def generate_verilog_and_tb_to_files(h, y_bit_length, save_dir):
     """
     Generate verilog and testbench files and save them inside save_dir
     """
+    # Get module parameters and reduction constants once for every generation step
+    params = get_mod_params(h, y_bit_length)
+    reduction_constants = list(iter_nonzero_reduction_constants(h, y_bit_length))
+
     # Generate and save submodule files
-    generate_submodules_verilog_and_tb_to_files(h, y_bit_length, save_dir)
+    generate_submodules_verilog_and_tb_to_files(h, y_bit_length, save_dir, params=params)
 
     # Create directory to put src and tb files
     src_dir = save_dir + "/src"
@@ -276,17 +409,38 @@ def generate_verilog_and_tb_to_files(h, y_bit_length, save_dir):
     path_out_tb_filename = tb_dir + "/" + out_tb_filename
 
     # Generate and save verilog code
-    verilog_code = generate_src(h, y_bit_length)
-    with open(path_out_filename, "w") as f:
-        f.write(verilog_code)
+    with open(path_out_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_src(h, y_bit_length, out=f, params=params, reduction_constants=reduction_constants)
     print(f"Verilog generated in {path_out_filename}")
 
     # Generate and save tb files
-    verilog_tb_code = generate_tb(h, y_bit_length)
-    with open(path_out_tb_filename, "w") as f:
-        f.write(verilog_tb_code)
+    with open(path_out_tb_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_tb(h, y_bit_length, out=f, params=params, reduction_constants=reduction_constants)
     print(f"Verilog testbench generated in {path_out_tb_filename}")
 
+def generate_many(h, y_bit_lengths, save_dir):
+    """
+    Generate verilog and testbench files for several input bit lengths with the same h(x)
+    and save them inside save_dir
+
+    The reduction constants are computed once, for the largest bit length, and every
+    module takes the first ones it needs (the constants do not depend on y_bit_length)
+    Nothing is generated for an empty y_bit_lengths, and an entry already cached for h(x)
+    is restored afterwards
+    """
+    if not y_bit_lengths:
+        return
+    previous_consts = REDUCTION_CONSTANTS_CACHE.get(h)
+    REDUCTION_CONSTANTS_CACHE[h] = get_reduction_constants(h, max(y_bit_lengths))
+    try:
+        for y_bit_length in y_bit_lengths:
+            generate_verilog_and_tb_to_files(h, y_bit_length, save_dir)
+    finally:
+        if previous_consts is None:
+            del REDUCTION_CONSTANTS_CACHE[h]
+        else:
+            REDUCTION_CONSTANTS_CACHE[h] = previous_consts
+
 def positive_int(value):
     """
     Check if given parameter is a positive integer
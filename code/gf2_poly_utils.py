@@ -14,18 +14,30 @@
 #     Supported operations:
 #         - Identifying bit positions in binary representation
 #         - Computing the degree of a binary polynomial
-#         - Performing polynomial modular reduction over GF(2)
+#         - Performing polynomial division and modular reduction over GF(2)
+#           (byte-table long division, sparse reduction for fixed moduli with a
+#           sparse low part or table reduction for low-degree moduli; Barrett
+#           reduction is available separately)
+#         - Computing carry-less products a(x)·b(x), squares p(x)^2 and powers a(x)^n mod h(x)
 #         - Computing affine transformations of the form a(x)·p(x) + c(x)
 #         - Reducing affine results modulo an irreducible polynomial h(x)
+#         - Computing polynomial gcds and testing irreducibility (Rabin's test)
+#         - Jumping n steps ahead in the affine recurrence in O(log n) operations
+#         - Generating successive states of the affine recurrence
+#         - Stepping batches of PRNGs that share h(x), packed into a single integer
 #
 # ==============================================================================
 
 
-from typing import List
+from typing import List, Optional, Tuple
 
+import functools
 import re
 
-def get_bit_positions(n: int) -> List[int]:
+# Set bit positions of every byte value, in decreasing order
+BYTE_BIT_POSITIONS = tuple(tuple(i for i in range(7, -1, -1) if byte >> i & 1) for byte in range(256))
+
+def get_bit_positions(n: int) -> Tuple[int, ...]:
     """
     Get positions of bits set to 1 in the binary representation of an integer.
 
@@ -33,21 +45,36 @@ def get_bit_positions(n: int) -> List[int]:
         n (int): The integer to analyze.
 
     Returns:
-        List[int]: List of bit positions where n has a '1' bit.
-                   The least significant bit is at position 0.
+        Tuple[int, ...]: Bit positions where n has a '1' bit, in decreasing order
+                         (highest degree term first).
+                         The least significant bit is at position 0.
 
     Example:
         >>> get_bit_positions(0b10110)
-        [1, 2, 4]  # Corresponds to x^1 + x^2 + x^4
+        (4, 2, 1)  # Corresponds to x^4 + x^2 + x^1
     """
+    bits = bin(n)[2:]
+    if 7 * bits.count("1") > len(bits):
+        # Dense integer: scan it a byte at a time (MSB first), looking up the set bits
+        # of each byte in a table instead of visiting them one at a time
+        positions = []
+        base = len(bits) + 7 & ~7
+        for byte in n.to_bytes(base >> 3, "big"):
+            base -= 8
+            if byte:
+                for bit in BYTE_BIT_POSITIONS[byte]:
+                    positions.append(base + bit)
+        return tuple(positions)
+
+    # Sparse integer: split the binary string (MSB first) at its '1' bits: each piece
+    # is the run of zeros before the next '1', so runs of zeros are skipped by str.split
+    # in C instead of being visited one bit at a time
     positions = []
-    position = 0
-    while n:
-        if n & 1:
-            positions.append(position)
-        n >>= 1
-        position += 1
-    return positions
+    position = len(bits)
+    for zeros in bits.split("1")[:-1]:
+        position -= len(zeros) + 1
+        positions.append(position)
+    return tuple(positions)
 
 
 def poly_degree(p: int) -> int:
@@ -66,26 +93,520 @@ def poly_degree(p: int) -> int:
     return p.bit_length() - 1
 
 
+def poly_divmod(y: int, h: int) -> Tuple[int, int]:
+    """
+    Compute quotient and remainder of y(x) / h(x) over GF(2), using XOR-based long division.
+
+    Parameters:
+        y (int): Dividend polynomial (as an integer).
+        h (int): Divisor polynomial (as an integer).
+
+    Returns:
+        Tuple[int, int]: Quotient q(x) and remainder r(x), with y(x) = q(x)·h(x) + r(x).
+    """
+    deg_h = poly_degree(h)
+    quot = 0
+    rem = y
+    # deg(rem) - deg(h), recomputed once per step from the new remainder
+    shift = rem.bit_length() - 1 - deg_h
+    while shift >= 0:
+        quot ^= 1 << shift
+        rem ^= h << shift
+        shift = rem.bit_length() - 1 - deg_h
+    return quot, rem
+
+
 def poly_mod(y: int, h: int) -> int:
     """
-    Compute y(x) mod h(x) over GF(2), using XOR-based long division.
+    Compute y(x) mod h(x) over GF(2).
+
+    Moduli with a sparse low part (see GF2Reducer) or of low degree (see GF2TableReducer)
+    are reduced with a cached reducer (see get_reducer), and everything else with
+    poly_mod_long_division. Barrett reduction (see poly_mod_barrett) is not used here:
+    it only breaks even with long division around deg(h) = 2^18 (far above any modulus
+    the generators use) and is slower beyond it.
 
     Parameters:
         y (int): Dividend polynomial (as an integer).
         h (int): Modulus polynomial (as an integer), typically irreducible.
 
+    Returns:
+        int: Remainder polynomial after modular reduction.
+    """
+    reducer = get_reducer(h)
+    if reducer is not None:
+        return reducer.reduce(y)
+    return poly_mod_long_division(y, h)
+
+
+def poly_mod_long_division(y: int, h: int) -> int:
+    """
+    Compute y(x) mod h(x) over GF(2), using XOR-based long division, clearing 8
+    coefficients per step with the cached byte table of h(x).
+
+    Parameters:
+        y (int): Dividend polynomial (as an integer).
+        h (int): Modulus polynomial (as an integer).
+
     Returns:
         int: Remainder polynomial after modular reduction.
     """
     deg_h = poly_degree(h)
     rem = y
-    while poly_degree(rem) >= deg_h:
-        shift = poly_degree(rem) - deg_h
+    shift = rem.bit_length() - deg_h - 8
+    if shift >= 0 and deg_h > 0:
+        # Clear the coefficients above x^deg(h) a byte at a time, from the top
+        table = get_reduction_byte_table(h)
+        while shift > 0:
+            rem ^= table[rem >> (deg_h + shift)] << shift
+            shift -= 8
+        return rem ^ table[rem >> deg_h]
+
+    # Fewer than 8 coefficients above x^deg(h) (or deg(h) = 0): one bit at a time
+    shift += 8
+    while shift >= 0:
         rem ^= h << shift
+        shift = rem.bit_length() - 1 - deg_h
     return rem
 
 
-def poly_affine(a: int, p: int, c: int) -> int:
+@functools.lru_cache(maxsize=64)
+def get_reduction_byte_table(h: int) -> Tuple[int, ...]:
+    """
+    Get the (cached) byte reduction table of h(x), used by poly_mod's long division.
+
+    Entry b is the multiple of h(x) whose coefficients above x^d (d = deg(h)) are the
+    bits of the byte b, that is, b(x)·x^d + (b(x)·x^d mod h(x)). XORing entry b into a
+    polynomial whose 8 top coefficients above x^d are b clears all of them with one
+    lookup, instead of up to 8 shifted XORs of h(x).
+
+    Parameters:
+        h (int): Modulus polynomial (as an integer), with deg(h) >= 1.
+
+    Returns:
+        Tuple[int, ...]: The 256 multiples of h(x), indexed by their top byte.
+    """
+    deg_h = poly_degree(h)
+    # x^(d+i) + (x^(d+i) mod h(x)), for i = 0..7
+    basis = []
+    rem = h ^ (1 << deg_h)
+    for i in range(8):
+        basis.append((1 << (deg_h + i)) | rem)
+        rem <<= 1
+        if rem >> deg_h:
+            rem ^= h
+    # Each entry is the entry without its lowest bit, plus that bit's multiple
+    table = [0] * 256
+    for byte in range(1, 256):
+        low = byte & -byte
+        table[byte] = table[byte ^ low] ^ basis[low.bit_length() - 1]
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=64)
+def get_barrett_constant(h: int) -> int:
+    """
+    Get the (cached) Barrett constant of h(x), used by poly_mod_barrett.
+
+    Parameters:
+        h (int): Modulus polynomial (as an integer), with deg(h) >= 1.
+
+    Returns:
+        int: mu(x) = floor(x^(2d) / h(x)), with d = deg(h).
+    """
+    return poly_divmod(1 << (2 * poly_degree(h)), h)[0]
+
+def poly_mod_barrett(y: int, h: int) -> int:
+    """
+    Compute y(x) mod h(x) over GF(2), using Barrett reduction.
+
+    With d = deg(h) and mu(x) = floor(x^(2d) / h(x)) (see get_barrett_constant),
+    any y(x) with deg(y) < 2d is reduced with two carry-less products:
+
+        q(x) = floor(floor(y(x) / x^d)·mu(x) / x^d)
+        y(x) mod h(x) = y(x) + q(x)·h(x)
+
+    Over GF(2) this quotient is exact, so no correction step is needed. Longer
+    inputs are reduced from the top, 2d coefficients at a time.
+
+    Parameters:
+        y (int): Dividend polynomial (as an integer).
+        h (int): Modulus polynomial (as an integer), with deg(h) >= 1.
+
+    Returns:
+        int: Remainder polynomial after modular reduction.
+    """
+    deg_h = poly_degree(h)
+    mu = get_barrett_constant(h)
+
+    # Reduce the top 2d coefficients until y(x) fits in a single Barrett step
+    while y.bit_length() > 2 * deg_h:
+        shift = y.bit_length() - 2 * deg_h
+        top = y >> shift
+        top ^= poly_mul(poly_mul(top >> deg_h, mu) >> deg_h, h)
+        y = (top << shift) ^ (y & ((1 << shift) - 1))
+
+    # Final Barrett step
+    if y.bit_length() > deg_h:
+        y ^= poly_mul(poly_mul(y >> deg_h, mu) >> deg_h, h)
+    return y
+
+
+class GF2Reducer:
+    """
+    Reduction modulo a fixed polynomial h(x) over GF(2), using its sparse low part.
+
+    With d = deg(h) and t(x) = h(x) - x^d (the tail of h(x)), x^d = t(x) mod h(x), so
+
+        y(x) = q(x)·x^d + r(x) = q(x)·t(x) + r(x)  (mod h(x))
+
+    Each round folds the part of y(x) above x^d back into its low d coefficients with one
+    shifted XOR per non-zero coefficient of t(x), and lowers deg(y) by at least
+    d - deg(t). The shifts of t(x) are computed once, when the reducer is built, so this
+    is fast for the trinomials and pentanomials usually chosen as field polynomials.
+    It works for any h(x), but is only efficient when deg(t) is well below d (see
+    get_reducer).
+
+    When deg(t) <= (d + 1)/2, a product of two reduced polynomials (at most 2d - 1 bits)
+    needs exactly 2 folds: the first leaves fewer than d + deg(t) bits, the second fewer
+    than d. For those h(x), reduce is a function generated for this h(x) (see
+    compile_reduce), with the 2 folds written out as straight-line code and d, the mask
+    and the shifts of t(x) as constants.
+
+    Attributes:
+        h (int): Modulus polynomial h(x), as an integer.
+        deg_h (int): Degree of h(x).
+        mask (int): Mask with the deg_h least significant bits set.
+        tail_shifts (Tuple[int, ...]): Bit positions of the tail t(x), in decreasing order.
+        reduce (Callable[[int], int]): Computes y(x) mod h(x) (see reduce_loop).
+    """
+
+    def __init__(self, h: int):
+        self.h = h
+        self.deg_h = poly_degree(h)
+        self.mask = (1 << self.deg_h) - 1
+        self.tail_shifts = get_bit_positions(h & self.mask)
+        self.reduce = self.compile_reduce()
+
+    def compile_reduce(self):
+        """
+        Generate the reduce function for this h(x): 2 written-out folds for inputs of up to
+        2·deg(h) - 1 bits, falling back to reduce_loop for longer inputs. Returns
+        reduce_loop itself if 2 folds are not always enough for such inputs.
+        """
+        deg_h = self.deg_h
+        tail_degree = self.tail_shifts[0] if self.tail_shifts else 0
+        if deg_h == 0 or 2 * tail_degree > deg_h + 1:
+            return self.reduce_loop
+
+        fold = "(y & %#x)" % self.mask + "".join(
+            " ^ top" if shift == 0 else " ^ (top << %d)" % shift for shift in self.tail_shifts
+        )
+        source = "\n".join((
+            "def reduce(y):",
+            "    if y.bit_length() > %d:" % (2 * deg_h - 1),
+            "        return reduce_loop(y)",
+            "    top = y >> %d" % deg_h,
+            "    y = " + fold,
+            "    top = y >> %d" % deg_h,
+            "    return " + fold,
+        ))
+        namespace = {"reduce_loop": self.reduce_loop}
+        exec(source, namespace)
+        return namespace["reduce"]
+
+    def reduce_loop(self, y: int) -> int:
+        """
+        Compute y(x) mod h(x), folding until no coefficient is left above x^d.
+
+        Parameters:
+            y (int): Dividend polynomial (as an integer).
+
+        Returns:
+            int: Remainder polynomial after modular reduction.
+        """
+        deg_h = self.deg_h
+        mask = self.mask
+        tail_shifts = self.tail_shifts
+        while y >> deg_h:
+            top = y >> deg_h
+            y &= mask
+            for shift in tail_shifts:
+                y ^= top << shift
+        return y
+
+
+# Moduli up to this degree without a sparse tail are reduced with a GF2TableReducer
+TABLE_REDUCER_MAX_DEGREE = 32
+
+class GF2TableReducer:
+    """
+    Reduction modulo a fixed polynomial h(x) of low degree over GF(2), using lookup tables.
+
+    With d = deg(h), a product of two reduced polynomials has at most 2d - 1 bits, so its
+    part above x^d has at most d - 1 bits. Since reduction is linear, y(x) mod h(x) is
+    the low d coefficients of y(x) XORed with the reduction of each byte of that part:
+    table k holds b(x)·x^(d+8k) mod h(x) for every byte b. The lookups do not depend on
+    each other, so reduce is a function generated for this h(x) with one lookup per byte
+    written out as a single expression, and no loop, whatever the tail of h(x).
+    For d <= TABLE_REDUCER_MAX_DEGREE this needs at most 4 tables.
+
+    Attributes:
+        h (int): Modulus polynomial h(x), as an integer.
+        deg_h (int): Degree of h(x).
+        mask (int): Mask with the deg_h least significant bits set.
+        tables (List[List[int]]): Reduction of each byte above x^d, lowest byte first.
+        reduce (Callable[[int], int]): Computes y(x) mod h(x) (see reduce_loop).
+    """
+
+    def __init__(self, h: int):
+        self.h = h
+        self.deg_h = poly_degree(h)
+        self.mask = (1 << self.deg_h) - 1
+
+        # x^(d+i) mod h(x), stepped one bit at a time
+        self.tables = []
+        basis = h & self.mask
+        for _ in range((self.deg_h + 6) // 8):
+            lane_basis = []
+            for _ in range(8):
+                lane_basis.append(basis)
+                basis <<= 1
+                if basis >> self.deg_h:
+                    basis ^= h
+            # Each entry is the entry without its lowest bit, plus that bit's term
+            table = [0] * 256
+            for byte in range(1, 256):
+                low = byte & -byte
+                table[byte] = table[byte ^ low] ^ lane_basis[low.bit_length() - 1]
+            self.tables.append(table)
+
+        self.reduce = self.compile_reduce()
+
+    def compile_reduce(self):
+        """
+        Generate the reduce function for this h(x): one table lookup per byte above x^d
+        for inputs of up to 2·deg(h) - 1 bits, falling back to reduce_loop for longer inputs.
+        """
+        deg_h = self.deg_h
+        lookups = "".join(
+            " ^ table_%d[top & 0xff]" % k if k == 0 else " ^ table_%d[top >> %d & 0xff]" % (k, 8 * k)
+            for k in range(len(self.tables))
+        )
+        source = "\n".join((
+            "def reduce(y):",
+            "    if y.bit_length() > %d:" % (2 * deg_h - 1),
+            "        return reduce_loop(y)",
+            "    top = y >> %d" % deg_h,
+            "    return (y & %#x)" % self.mask + lookups,
+        ))
+        namespace = {"reduce_loop": self.reduce_loop}
+        for k, table in enumerate(self.tables):
+            namespace["table_%d" % k] = table
+        exec(source, namespace)
+        return namespace["reduce"]
+
+    def reduce_loop(self, y: int) -> int:
+        """
+        Compute y(x) mod h(x), for any y(x), with poly_mod_long_division.
+
+        Parameters:
+            y (int): Dividend polynomial (as an integer).
+
+        Returns:
+            int: Remainder polynomial after modular reduction.
+        """
+        return poly_mod_long_division(y, self.h)
+
+
+@functools.lru_cache(maxsize=64)
+def get_reducer(h: int):
+    """
+    Get a (cached) reducer for h(x), if there is one faster than long division:
+
+        - GF2Reducer, if the tail t(x) = h(x) - x^deg(h) has degree at most deg(h)/2, so
+          each reduction round removes at least half of the coefficients above x^deg(h).
+        - GF2TableReducer otherwise, if deg(h) <= TABLE_REDUCER_MAX_DEGREE.
+
+    Parameters:
+        h (int): Modulus polynomial (as an integer).
+
+    Returns:
+        GF2Reducer, GF2TableReducer or None: Reducer for h(x), or None if h(x) has a dense
+        tail and a high degree.
+    """
+    deg_h = poly_degree(h)
+    tail = h ^ (1 << deg_h)
+    if 2 * poly_degree(tail) <= deg_h:
+        return GF2Reducer(h)
+    if deg_h <= TABLE_REDUCER_MAX_DEGREE:
+        return GF2TableReducer(h)
+    return None
+
+
+# Operands up to this bit length are multiplied bit by bit (sparse operands) or
+# 3 bits at a time (dense operands); above it, poly_mul switches to a windowed
+# (table-driven) carry-less multiplication with wider windows
+MUL_WINDOW_THRESHOLD = 64
+
+# Window width used by poly_mul as a function of the shortest operand bit length,
+# given as (max_bit_length, window_bits) pairs; wider operands use MUL_MAX_WINDOW_BITS
+MUL_WINDOW_BITS = ((512, 4), (2048, 6))
+MUL_MAX_WINDOW_BITS = 8
+
+# Operands with more bits than this (and of similar size) are split in halves and
+# multiplied with Karatsuba's method, which needs 3 half-size products instead of 4
+MUL_KARATSUBA_THRESHOLD = 16384
+
+def poly_mul(a: int, b: int) -> int:
+    """
+    Compute the carry-less product a(x)·b(x) over GF(2).
+
+    Small sparse operands are multiplied with one shifted XOR per non-zero coefficient,
+    and small dense ones 3 coefficients at a time, using the 8 multiples of b(x) by
+    polynomials of degree < 3 (this plays the role of a hardware carry-less multiply
+    instruction for words up to MUL_WINDOW_THRESHOLD bits). Wider operands are processed
+    w coefficients at a time, using a precomputed table with every multiple w(x)·b(x)
+    for deg(w(x)) < w, which cuts the number of big-integer shift/XOR operations. The
+    window width w grows with the operand size (see MUL_WINDOW_BITS), since the table
+    cost is amortized over more windows. Wide operands with fewer non-zero coefficients
+    than the windowed method would do big-integer operations go back to one shifted XOR
+    per coefficient of the sparser one. Very large operands of similar size are first
+    split with Karatsuba's method (see MUL_KARATSUBA_THRESHOLD):
+
+        a(x)·b(x) = d0(x) + (d1(x) + d0(x) + d2(x))·x^m + d2(x)·x^(2m)
+
+    where d0 = a0·b0, d2 = a1·b1, d1 = (a0 + a1)·(b0 + b1), with a(x) = a1(x)·x^m + a0(x)
+    and b(x) = b1(x)·x^m + b0(x).
+
+    Parameters:
+        a (int): First polynomial a(x), as an integer.
+        b (int): Second polynomial b(x), as an integer.
+
+    Returns:
+        int: Product a(x)·b(x) without modular reduction.
+    """
+    # Iterate over the shortest operand
+    if a.bit_length() > b.bit_length():
+        a, b = b, a
+
+    if a.bit_length() <= MUL_WINDOW_THRESHOLD:
+        # Schoolbook multiplication, when a(x) has few non-zero coefficients
+        # (one shifted XOR per coefficient beats one per 3 bits plus the table)
+        if 3 * (bin(a).count("1") + 3) <= a.bit_length():
+            out = 0
+            for i in get_bit_positions(a):
+                out ^= b << i
+            return out
+
+        # 3-bit window multiplication
+        b2 = b << 1
+        b4 = b << 2
+        table = (0, b, b2, b2 ^ b, b4, b4 ^ b, b4 ^ b2, b4 ^ b2 ^ b)
+        out = 0
+        shift = 0
+        while a:
+            out ^= table[a & 7] << shift
+            a >>= 3
+            shift += 3
+        return out
+
+    # Select the window width for this operand size
+    w = MUL_MAX_WINDOW_BITS
+    for max_bit_length, window_bits in MUL_WINDOW_BITS:
+        if a.bit_length() <= max_bit_length:
+            w = window_bits
+            break
+
+    # Schoolbook multiplication over the sparser operand, when it has at most half as
+    # many non-zero coefficients as table entries plus windows (each schoolbook step
+    # is roughly twice as expensive as a windowed one)
+    ones_a = bin(a).count("1")
+    ones_b = bin(b).count("1")
+    if 2 * min(ones_a, ones_b) <= (a.bit_length() // w) + (1 << w):
+        if ones_b < ones_a:
+            a, b = b, a
+        out = 0
+        for i in get_bit_positions(a):
+            out ^= b << i
+        return out
+
+    # Karatsuba multiplication (only for operands of similar size, otherwise
+    # the a(x) halves would be mostly zero and the split would add work)
+    if a.bit_length() > MUL_KARATSUBA_THRESHOLD and 4 * a.bit_length() > 3 * b.bit_length():
+        m = b.bit_length() // 2
+        mask = (1 << m) - 1
+        a0, a1 = a & mask, a >> m
+        b0, b1 = b & mask, b >> m
+        d0 = poly_mul(a0, b0)
+        d2 = poly_mul(a1, b1)
+        d1 = poly_mul(a0 ^ a1, b0 ^ b1)
+        return d0 ^ ((d1 ^ d0 ^ d2) << m) ^ (d2 << (2 * m))
+
+    # Table with all products w(x)·b(x) for each window value w(x)
+    table = [0] * (1 << w)
+    for i in range(1, 1 << w):
+        table[i] = table[i ^ 1] ^ b if i & 1 else table[i >> 1] << 1
+
+    # Windowed multiplication
+    out = 0
+    shift = 0
+    mask = (1 << w) - 1
+    while a:
+        out ^= table[a & mask] << shift
+        a >>= w
+        shift += w
+    return out
+
+# Square of every byte value b(x) (its bits spread to the even positions), as 2 little-endian
+# bytes: over GF(2) the cross terms of a square cancel, so p(x)^2 = sum of p_i·x^(2i)
+BYTE_SQUARES = tuple(
+    sum(1 << (2 * i) for i in range(8) if byte >> i & 1).to_bytes(2, "little") for byte in range(256)
+)
+
+def poly_square(p: int) -> int:
+    """
+    Compute the square p(x)^2 over GF(2).
+
+    Squaring only spreads the coefficients of p(x) (the coefficient of x^i moves to
+    x^(2i)), so it is done a byte at a time with the BYTE_SQUARES table instead of a
+    full multiplication.
+
+    Parameters:
+        p (int): Polynomial represented as an integer.
+
+    Returns:
+        int: Square of p(x), as an integer.
+    """
+    data = p.to_bytes((p.bit_length() + 7) // 8, "little")
+    return int.from_bytes(b"".join([BYTE_SQUARES[byte] for byte in data]), "little")
+
+def poly_pow_mod(a: int, n: int, h: int) -> int:
+    """
+    Compute a(x)^n mod h(x) over GF(2), by square-and-multiply over the bits of n.
+
+    Unlike poly_affine_mod_jump, results are not cached, so one-off powers (e.g. the
+    generator checks of get_log_tables) do not evict the cached jump maps.
+
+    Parameters:
+        a (int): Base polynomial a(x), as an integer.
+        n (int): Exponent (non-negative).
+        h (int): Modulus polynomial h(x), as an integer.
+
+    Returns:
+        int: a(x)^n mod h(x), as an integer.
+    """
+    result = poly_mod(1, h)
+    base = poly_mod(a, h)
+    while n:
+        if n & 1:
+            result = poly_mod(poly_mul(result, base), h)
+        base = poly_mod(poly_square(base), h)
+        n >>= 1
+    return result
+
+
+def poly_affine(a: int, p: int, c: int, a_ones: Optional[Tuple[int, ...]] = None) -> int:
     """
     Compute a(x)·p(x) + c(x) over GF(2), where all polynomials have binary coefficients.
 
@@ -93,6 +614,10 @@ def poly_affine(a: int, p: int, c: int) -> int:
         a (int): Multiplier polynomial a(x), as an integer.
         p (int): Input polynomial p(x), as an integer.
         c (int): Constant polynomial c(x), as an integer.
+        a_ones (Tuple[int, ...], optional): Bit positions of a(x), as returned by
+            get_bit_positions(a). When a(x) is fixed across many calls (e.g. the
+            recurrence coefficient of a PRNG), passing them once skips the bit scan
+            and multiplies with one shifted XOR per coefficient of a(x).
 
     Returns:
         int: Result of a(x)·p(x) + c(x) without modular reduction.
@@ -100,34 +625,521 @@ def poly_affine(a: int, p: int, c: int) -> int:
     Note:
         This operation corresponds to a linear feedback transformation.
     """
-    out = 0
-    for i in get_bit_positions(a):
+    if a_ones is None:
+        return poly_mul(a, p) ^ c
+    out = c
+    for i in a_ones:
         out ^= p << i
-    return out ^ c
+    return out
+
 
+# poly_affine_mod multiplies and reduces in a single Horner pass over a(x) when a(x)
+# has at most this many bits (each bit costs a shift and up to two XORs)
+AFFINE_MOD_HORNER_MAX_BITS = 8
 
-def poly_affine_mod(a: int, p: int, c: int, h: int) -> int:
+def poly_affine_mod(a: int, p: int, c: int, h: int, a_ones: Optional[Tuple[int, ...]] = None) -> int:
     """
     Compute a(x)·p(x) + c(x) mod h(x) over GF(2).
 
+    For a short a(x) (see AFFINE_MOD_HORNER_MAX_BITS) and reduced p(x) and c(x), the
+    product is reduced while it is built, with Horner's rule over the coefficients of
+    a(x) (MSB first): acc(x) = acc(x)·x mod h(x) + a_i·p(x). The accumulator never
+    has more than deg(h) bits, so a single conditional XOR of h(x) reduces each step,
+    and the unreduced product is never built.
+
     Parameters:
         a (int): Multiplier polynomial a(x), as an integer.
         p (int): Input polynomial p(x), as an integer.
         c (int): Constant polynomial c(x), as an integer.
         h (int): Irreducible modulus polynomial h(x), as an integer.
+        a_ones (Tuple[int, ...], optional): Precomputed bit positions of a(x)
+            (see poly_affine).
 
     Returns:
         int: Final result of the affine transformation reduced modulo h(x).
     """
-    result = poly_affine(a, p, c)
+    deg_h = poly_degree(h)
+    if (a_ones is None and a.bit_length() <= AFFINE_MOD_HORNER_MAX_BITS
+            and deg_h > 0 and not p >> deg_h and not c >> deg_h):
+        acc = 0
+        for bit in bin(a)[2:]:
+            acc <<= 1
+            if acc >> deg_h:
+                acc ^= h
+            if bit == "1":
+                acc ^= p
+        return acc ^ c
+
+    result = poly_affine(a, p, c, a_ones)
     return poly_mod(result, h)
 
+@functools.lru_cache(maxsize=64)
+def poly_affine_mod_jump(a: int, c: int, h: int, n: int) -> Tuple[int, int]:
+    """
+    Compute the (cached) affine map that applies n steps of x_{k+1}(x) = a(x)·x_k(x) + c(x) mod h(x)
+    at once, so that x_{k+n}(x) = A(x)·x_k(x) + C(x) mod h(x), with
+
+        A(x) = a(x)^n mod h(x)
+        C(x) = c(x)·(a(x)^(n-1) + ... + a(x) + 1) mod h(x)
+
+    The maps are combined by square-and-multiply over the bits of n, so this takes
+    O(log n) multiplications instead of n steps. Then poly_affine_mod(A, x, C, h)
+    jumps n steps ahead from any x(x). Regenerating the testbench of the same PRNG, or
+    drawing several test vectors, reuses the map.
+
+    Parameters:
+        a (int): Multiplier polynomial a(x), as an integer.
+        c (int): Constant polynomial c(x), as an integer.
+        h (int): Irreducible modulus polynomial h(x), as an integer.
+        n (int): Number of steps (non-negative).
+
+    Returns:
+        Tuple[int, int]: Multiplier A(x) and constant C(x) of the n-step map.
+    """
+    # n-step map (starts as the identity) and 2^i-step map (starts as a single step)
+    jump_a, jump_c = 1, 0
+    step_a, step_c = poly_mod(a, h), poly_mod(c, h)
+    while n:
+        if n & 1:
+            # Apply the 2^i-step map after the current n-step map
+            jump_a = poly_mod(poly_mul(step_a, jump_a), h)
+            jump_c = poly_affine_mod(step_a, jump_c, step_c, h)
+        # Compose the 2^i-step map with itself
+        step_c = poly_affine_mod(step_a, step_c, step_c, h)
+        step_a = poly_mod(poly_mul(step_a, step_a), h)
+        n >>= 1
+    return poly_mod(jump_a, h), jump_c
+
+# Approximate cost of building one byte lane of mul-by-a(x) tables, in shifted XORs
+# of the bit-position step: poly_affine_mod_stream only switches to the tables when
+# the steps they save pay for building them
+MUL_TABLE_LANE_COST = 300
+
+def get_mul_mod_byte_tables(a: int, h: int) -> List[List[int]]:
+    """
+    Build the byte lane tables of the map x(x) -> a(x)·x(x) mod h(x), for x(x) of degree
+    lower than deg(h): table k holds a(x)·b(x)·x^(8k) mod h(x) for every byte b = 0..255,
+    so a(x)·x(x) mod h(x) is the XOR of one table entry per byte of x(x).
+
+    Parameters:
+        a (int): Multiplier polynomial a(x), as an integer.
+        h (int): Irreducible modulus polynomial h(x), as an integer.
+
+    Returns:
+        List[List[int]]: One 256-entry table per byte of x(x), least significant byte first.
+    """
+    deg_h = poly_degree(h)
+    tables = []
+    # a(x)·x^i mod h(x), stepped one bit at a time
+    basis = poly_mod(a, h)
+    for _ in range((deg_h + 7) // 8):
+        lane_basis = []
+        for _ in range(8):
+            lane_basis.append(basis)
+            basis <<= 1
+            if basis >> deg_h:
+                basis ^= h
+        # Each entry is the entry without its lowest bit, plus that bit's term
+        table = [0] * 256
+        for byte in range(1, 256):
+            low = byte & -byte
+            table[byte] = table[byte ^ low] ^ lane_basis[low.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+def get_prime_factors(n: int) -> List[int]:
+    """
+    Get the distinct prime factors of n, in increasing order, by trial division.
+
+    Parameters:
+        n (int): Positive integer.
+
+    Returns:
+        List[int]: Distinct prime factors of n.
+    """
+    prime_factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            prime_factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        prime_factors.append(n)
+    return prime_factors
+
+def poly_gcd(a: int, b: int) -> int:
+    """
+    Compute the greatest common divisor of a(x) and b(x) over GF(2), by Euclid's algorithm.
+
+    Parameters:
+        a (int): Polynomial represented as an integer.
+        b (int): Polynomial represented as an integer.
+
+    Returns:
+        int: gcd(a(x), b(x)), as an integer (0 only if a(x) = b(x) = 0).
+    """
+    while b:
+        a, b = b, poly_mod(a, b)
+    return a
+
+@functools.lru_cache(maxsize=64)
+def poly_is_irreducible(h: int) -> bool:
+    """
+    Check whether h(x) is irreducible over GF(2), with Rabin's test.
+
+    Results are cached, since the GUI checks the same h(x) again on every
+    "Generate" click while a(x) and c(x) are being tweaked.
+
+    With d = deg(h), h(x) is irreducible if and only if
+
+        x^(2^d) = x mod h(x), and
+        gcd(x^(2^(d/r)) - x, h(x)) = 1 for every prime factor r of d
+
+    The powers x^(2^k) mod h(x) are built by d successive squarings (see poly_square),
+    so the test takes O(d) squarings and reductions instead of trying every possible
+    factor of h(x).
+
+    Parameters:
+        h (int): Polynomial represented as an integer.
+
+    Returns:
+        bool: True if h(x) is irreducible (degree at least 1), False otherwise.
+    """
+    deg_h = poly_degree(h)
+    if deg_h < 1:
+        return False
+
+    # Squarings k = d/r after which x^(2^k) - x must be coprime with h(x)
+    gcd_checks = {deg_h // r for r in get_prime_factors(deg_h)}
+
+    x = poly_mod(0b10, h)
+    power = x
+    for k in range(1, deg_h + 1):
+        power = poly_mod(poly_square(power), h)
+        if k in gcd_checks and poly_gcd(h, power ^ x) != 1:
+            return False
+    return power == x
+
+# Fields GF(2^e) up to this degree get discrete log/antilog tables in
+# poly_affine_mod_stream (2^e entries each), when the stream is long enough
+# (at least 2 steps per table entry) to pay for building them
+LOG_TABLE_MAX_DEGREE = 16
+
+@functools.lru_cache(maxsize=8)
+def get_log_tables(h: int) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Get the (cached) discrete log and antilog tables of GF(2^e) = GF(2)[x]/h(x).
+
+    With g(x) a generator of the multiplicative group (of order q - 1, q = 2^e), every
+    non-zero element is g(x)^k for a single k < q - 1, so
+
+        u(x)·v(x) mod h(x) = antilog[log[u] + log[v]]
+
+    The antilog table covers 2·(q - 1) exponents, so the sum needs no reduction
+    modulo q - 1.
+
+    Parameters:
+        h (int): Irreducible modulus polynomial h(x), as an integer.
+
+    Returns:
+        Tuple[List[int], List[int]] or None: log and antilog tables, or None if no
+        generator is found among the first candidates (h(x) is not irreducible).
+    """
+    deg_h = poly_degree(h)
+    if deg_h < 1:
+        return None
+    group_order = (1 << deg_h) - 1
+
+    # Prime factors of the group order
+    prime_factors = get_prime_factors(group_order)
+
+    # g(x) generates the group if g^(q-1) = 1 and g^((q-1)/r) != 1 for every prime factor r
+    # (in a ring that is not a field, no element can have order q - 1)
+    for generator in range(1, min(1 << deg_h, 64)):
+        if poly_pow_mod(generator, group_order, h) != 1:
+            continue
+        if all(poly_pow_mod(generator, group_order // r, h) != 1 for r in prime_factors):
+            break
+    else:
+        return None
+
+    log = [0] * (1 << deg_h)
+    antilog = [0] * (2 * group_order)
+    power = 1
+    for k in range(group_order):
+        antilog[k] = antilog[k + group_order] = power
+        log[power] = k
+        power = poly_affine_mod(generator, power, 0, h)
+    return log, antilog
+
+def poly_affine_mod_stream(a: int, c: int, h: int, x: int, n: int) -> List[int]:
+    """
+    Generate n successive states of the recurrence x_{k+1}(x) = a(x)·x_k(x) + c(x) mod h(x).
+
+    Everything that does not change between steps (bit positions of a(x), the reducer
+    for h(x)) is computed once, and the step loop only runs shifted XORs and the
+    reduction, with no per-step function dispatch. For long streams with a dense a(x),
+    the steps use byte lane tables of a(x)·x(x) mod h(x) instead (see
+    get_mul_mod_byte_tables): one lookup and XOR per byte of the state, and no reduction.
+    Long streams over small fields (see LOG_TABLE_MAX_DEGREE) multiply with discrete
+    log/antilog tables instead (see get_log_tables): two lookups per step.
+
+    Parameters:
+        a (int): Multiplier polynomial a(x), as an integer.
+        c (int): Constant polynomial c(x), as an integer.
+        h (int): Irreducible modulus polynomial h(x), as an integer.
+        x (int): Initial state x_0(x), as an integer.
+        n (int): Number of states to generate.
+
+    Returns:
+        List[int]: States x_1(x), ..., x_n(x).
+    """
+    a = poly_mod(a, h)
+    c = poly_mod(c, h)
+    a_ones = get_bit_positions(a)
+    states = []
+    append = states.append
+
+    deg_h = poly_degree(h)
+    log_tables = None
+    if a and deg_h <= LOG_TABLE_MAX_DEGREE and n >= 2 << deg_h:
+        log_tables = get_log_tables(h)
+    if log_tables is not None:
+        log, antilog = log_tables
+        log_a = log[a]
+        x = poly_mod(x, h)
+        for _ in range(n):
+            x = antilog[log_a + log[x]] ^ c if x else c
+            append(x)
+        return states
+
+    num_bytes = (deg_h + 7) // 8
+    if n * (len(a_ones) - num_bytes) > MUL_TABLE_LANE_COST * num_bytes:
+        tables = get_mul_mod_byte_tables(a, h)
+        x = poly_mod(x, h)
+        for _ in range(n):
+            y = c
+            for table, byte in zip(tables, x.to_bytes(num_bytes, "little")):
+                y ^= table[byte]
+            x = y
+            append(x)
+        return states
+
+    reducer = get_reducer(h)
+    if reducer is None:
+        for _ in range(n):
+            y = c
+            for i in a_ones:
+                y ^= x << i
+            x = poly_mod(y, h)
+            append(x)
+        return states
+
+    reduce = reducer.reduce
+    for _ in range(n):
+        y = c
+        for i in a_ones:
+            y ^= x << i
+        x = reduce(y)
+        append(x)
+    return states
+
+class GF2ePRNGBatch:
+    """
+    A batch of independent PRNGs x_{k+1}(x) = a_j(x)·x_k(x) + c_j(x) mod h(x), sharing the
+    modulus h(x) but each with its own a_j(x), c_j(x) and state, stepped together.
+
+    The states are stored packed side by side in a single integer, one lane of 2·deg(h)
+    bits per PRNG (wide enough for the unreduced product), so each step runs a fixed
+    number of big integer operations over the whole batch, independent of its size:
+
+        - Multiplication: for each bit i of the a_j(x), the lanes whose a_j(x) has that
+          bit set are selected with a precomputed mask and XORed in shifted by i.
+        - Reduction: with a sparse tail t(x) (see GF2Reducer), the part above x^d of every
+          lane is folded back into its low d coefficients at once. Otherwise every
+          coefficient above x^d is cleared from the top, by XORing h(x) into the lanes
+          that have it set (their lane-base bits times h(x), which never carries, since
+          the lanes never overlap).
+
+    Attributes:
+        h (int): Modulus polynomial h(x), as an integer.
+        deg_h (int): Degree of h(x).
+        size (int): Number of PRNGs in the batch.
+        lane_bits (int): Width of each lane, in bits.
+    """
+
+    def __init__(self, multipliers: List[int], constants: List[int], h: int, states: List[int]):
+        """
+        Parameters:
+            multipliers (List[int]): Multiplier polynomials a_j(x), one per PRNG.
+            constants (List[int]): Constant polynomials c_j(x), one per PRNG.
+            h (int): Irreducible modulus polynomial h(x), with deg(h) >= 1.
+            states (List[int]): Initial states x_0(x), one per PRNG.
+        """
+        self.h = h
+        self.deg_h = poly_degree(h)
+        self.size = len(states)
+        self.lane_bits = 2 * self.deg_h
+
+        # Lane-base bits of every lane, and the mask of the low deg_h bits of every lane
+        self.lane_ones = self.pack([1] * self.size)
+        self.low_mask = self.lane_ones * ((1 << self.deg_h) - 1)
+
+        multipliers = [poly_mod(a, h) for a in multipliers]
+        # Masks selecting the lanes whose a_j(x) has bit i set, for each bit i in use
+        self.multiplier_masks = []
+        for i in range(self.deg_h):
+            lane_mask = self.pack([a >> i & 1 for a in multipliers]) * ((1 << self.deg_h) - 1)
+            if lane_mask:
+                self.multiplier_masks.append((i, lane_mask))
+
+        self.constants = self.pack([poly_mod(c, h) for c in constants])
+        self.states = self.pack([poly_mod(x, h) for x in states])
+
+        reducer = get_reducer(h)
+        self.tail_shifts = reducer.tail_shifts if isinstance(reducer, GF2Reducer) else None
+
+    def pack(self, values: List[int]) -> int:
+        """
+        Pack values (each lower than 2^lane_bits) into lanes, the first value in the lowest lane.
+        """
+        lane_format = "0%db" % self.lane_bits
+        return int("".join(format(value, lane_format) for value in reversed(values)) or "0", 2)
+
+    def unpack(self, packed: int) -> List[int]:
+        """
+        Unpack the lanes of packed into a list of values, lowest lane first.
+        """
+        lane_bits = self.lane_bits
+        total_bits = lane_bits * self.size
+        bits = format(packed, "0%db" % total_bits)
+        return [int(bits[i - lane_bits:i], 2) for i in range(total_bits, 0, -lane_bits)]
+
+    def step(self) -> List[int]:
+        """
+        Advance every PRNG of the batch by one step.
+
+        Returns:
+            List[int]: New states x_{k+1}(x), one per PRNG.
+        """
+        self.advance(1)
+        return self.get_states()
+
+    def get_states(self) -> List[int]:
+        """
+        Get the current state of every PRNG of the batch.
+
+        Returns:
+            List[int]: Current states, one per PRNG.
+        """
+        return self.unpack(self.states)
+
+    def advance(self, steps: int):
+        """
+        Advance every PRNG of the batch by steps steps, keeping the states packed in
+        between (only get_states unpacks them), so long runs of the whole batch cost only
+        the packed big integer operations of each step.
+
+        Parameters:
+            steps (int): Number of steps.
+        """
+        deg_h = self.deg_h
+        constants = self.constants
+        multiplier_masks = self.multiplier_masks
+        tail_shifts = self.tail_shifts
+        low_mask = self.low_mask
+        h = self.h
+        lane_ones = self.lane_ones
+        x = self.states
+
+        for _ in range(steps):
+            # y_j(x) = a_j(x)·x_j(x) + c_j(x), in every lane
+            y = constants
+            for i, lane_mask in multiplier_masks:
+                y ^= (x & lane_mask) << i
+
+            # Reduce every lane modulo h(x)
+            if tail_shifts is not None:
+                top = (y >> deg_h) & low_mask
+                while top:
+                    y &= low_mask
+                    for shift in tail_shifts:
+                        y ^= top << shift
+                    top = (y >> deg_h) & low_mask
+            else:
+                for j in range(2 * deg_h - 2, deg_h - 1, -1):
+                    lanes = (y >> j) & lane_ones
+                    if lanes:
+                        y ^= (lanes * h) << (j - deg_h)
+            x = y
+
+        self.states = x
+
+# Terms of an algebraic polynomial string: x^n, x, or 1
+ALG_TERM_RE = re.compile(r'x\^\d+|x|1')
+
+# str.translate table that deletes spaces
+REMOVE_SPACES = {ord(" "): None}
+
+def alg_str_to_int(poly_str: str) -> int:
+    """
+    Convert an algebraic polynomial string without spaces (e.g. "x^4+1") to an integer.
+    """
+    # Match terms like x^n, x, or 1
+    value = 0
+    for term in ALG_TERM_RE.findall(poly_str):
+        if term == '1':
+            degree = 0
+        elif term == 'x':
+            degree = 1
+        else:  # term like x^n
+            degree = int(term[2:])
+
+        value |= 1 << degree
+    return value
+
+def int_to_alg_str(poly_int: int) -> str:
+    """
+    Convert a non-negative integer to an algebraic polynomial string (e.g. "x^4 + 1").
+    """
+    # If the polynomial given is 0, return "0"
+    if poly_int == 0:
+        return "0"
+
+    # Get polynomial bit positions with non-zero coefficients in decreasing order
+    poly_ones = get_bit_positions(poly_int)
+
+    # Generate polynomial str (single comprehension, with the term format inlined)
+    return " + ".join(["1" if order == 0 else "x" if order == 1 else f"x^{order}"
+                       for order in poly_ones])
+
+# Parsers used by str_poly_to_int for each input format (strings without spaces);
+# new formats can be registered by adding entries
+STR_TO_INT_PARSERS = {
+    # Guarantee that int polynomial is positive
+    "int": lambda poly_str: abs(int(poly_str)),
+    "hex": lambda poly_str: int(poly_str, 16),
+    "bin": lambda poly_str: int(poly_str, 2),
+    "alg": alg_str_to_int,
+}
+
+# Formatters used by int_poly_to_str for each output format (non-negative integers);
+# new formats can be registered by adding entries
+INT_TO_STR_FORMATTERS = {
+    "int": str,
+    "hex": hex,
+    "bin": bin,
+    "alg": int_to_alg_str,
+}
+
 def str_poly_to_int(poly_str: str, poly_format: str) -> int:
     """
     Converts a binary polynomial over GF(2), given as a string into 
     its corresponding integer representation.
 
-    Allowed input str format:
+    Allowed input str format (see STR_TO_INT_PARSERS):
         - int  (e.g. "17")
         - hex  (e.g. "0x11")
         - bin  (e.g. "0b10001")
@@ -143,43 +1155,26 @@ def str_poly_to_int(poly_str: str, poly_format: str) -> int:
     Example:
         str_poly_to_int("x^3 + x + 1", "alg") -> 11 (0b1011)
     """
-    # Remove spaces for easier processing
-    poly_str = poly_str.replace(" ", "")
-
-    if poly_format == "int":
-        # Guarantee that int polynomial is positive
-        poly_int = abs(int(poly_str))
-        return poly_int
-    elif poly_format == "hex":
-        poly_int = int(poly_str, 16)
-        return poly_int
-    elif poly_format == "bin":
-        poly_int = int(poly_str, 2)
-        return poly_int
-    elif poly_format == "alg":
-        # Match terms like x^n, x, or 1
-        terms = re.findall(r'x\^\d+|x|1', poly_str)
-        value = 0
-        for term in terms:
-            if term == '1':
-                degree = 0
-            elif term == 'x':
-                degree = 1
-            else:  # term like x^n
-                degree = int(term[2:])
-
-            value |= 1 << degree
-        poly_int = value
-        return poly_int
-    else:
+    parser = STR_TO_INT_PARSERS.get(poly_format)
+    if parser is None:
         raise Exception(f"{poly_format} is not a valid polynomial format.")
 
+    # Remove spaces for easier processing (a new string is only built if there are any)
+    if " " in poly_str:
+        poly_str = poly_str.translate(REMOVE_SPACES)
+
+    return parser(poly_str)
+
+@functools.lru_cache(maxsize=1024)
 def int_poly_to_str(poly_int: int, poly_format: str) -> str:
     """
     Converts a binary polynomial over GF(2), given as an integer (e.g., 11),
     into its corresponding string representation format.
 
-    Allowed output str format:
+    Results are cached, since the generators print the same a(x), c(x) and h(x)
+    in the headers of every module and testbench.
+
+    Allowed output str format (see INT_TO_STR_FORMATTERS):
         - int  (e.g. "17")
         - hex  (e.g. "0x11")
         - bin  (e.g. "0b10001")
@@ -195,37 +1190,11 @@ def int_poly_to_str(poly_int: int, poly_format: str) -> str:
     Example:
         int_poly_to_str(11) -> "x^3 + x + 1"
     """
+    formatter = INT_TO_STR_FORMATTERS.get(poly_format)
+    if formatter is None:
+        raise Exception(f"{poly_format} is not a valid polynomial format.")
+
     # Guarantee that int polynomial is positive/valid
     poly_int = abs(int(poly_int))
 
-    if poly_format == "int":
-        poly_str = str(poly_int) 
-        return poly_str
-    elif poly_format == "hex":
-        poly_str = hex(poly_int) 
-        return poly_str
-    elif poly_format == "bin":
-        poly_str = bin(poly_int) 
-        return poly_str
-    elif poly_format == "alg":
-        # If the polynomial given is 0, return "0"
-        if poly_int == 0:
-            return "0"
-
-        # Get polynomial bit positions with non-zero coefficients in decreasing order
-        poly_ones = get_bit_positions(poly_int)[::-1]
-
-        # Generate polynomial str
-        poly_terms = []
-        for order in poly_ones:
-            if order == 0:
-                poly_terms.append("1")
-            elif order == 1:
-                poly_terms.append("x")
-            else:
-                poly_terms.append(f"x^{order}")
-        poly_str = " + ".join(poly_terms) 
-        return poly_str
-    else:
-        raise Exception(f"{poly_format} is not a valid polynomial format.")
-
+    return formatter(poly_int)
@@ -73,32 +73,344 @@
 from gf2_poly_utils import *
 
 import argparse
+import functools
 import gf2_poly_affine_mod_generator
 import os
 import random
 import shutil
+import sys
+
+# Absolute path to the dir containing this script
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Absolute path to the base modelsim dir
+BASE_MODELSIM_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "modelsim"))
+
+# Absolute path to the base LICENSE file
+LICENSE_PATH = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "LICENSE"))
+
+# Encoding of generated files (fixed, so output does not depend on the platform's locale)
+WRITE_ENCODING = "utf-8"
+
+# Directories created by this process (see ensure_dir)
+CREATED_DIRS = set()
+
+# Buffer size of copy_file's fallback copy, used where os.sendfile is not available
+# (1 MiB, fixed here: shutil's own default is 1 MiB only on Windows, 64 KiB elsewhere)
+COPY_BUFFER_SIZE = 1 << 20
+
+# Whether copy_file copies with os.sendfile (file to file only works on Linux: macOS and
+# the BSDs have os.sendfile too, but only for sockets; same check as shutil's)
+USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+# Project README (README_TEMPLATE), main module (SRC_TEMPLATE) and testbench (TB_TEMPLATE)
+# text, ready for str.format. Only bit lengths, polynomial strings and the test
+# vector change between projects, so the text is laid out once here and filled in per (a, c, h)
+README_TEMPLATE = "\n".join((
+    "# Pseudorandom Number Generator (PRNG) over GF(2^{e})",
+    "",
+    "Author      : Davi Moreno",
+    "Affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE",
+    "",
+    "Implements a PRNG based on the affine recurrence relation:",
+    "```",
+    "    x_{{n+1}}(x) = a(x)·x_n(x) + c(x) mod h(x)",
+    "```",
+    "All polynomials have binary coefficients (0 or 1). The recurrence operates",
+    "over the finite field GF(2^{e}), defined by the irreducible polynomial h(x).",
+    "",
+    "Constant polynomials given as:",
+    "- a(x) = {a_alg}   // {bit_length}-bit vector",
+    "- c(x) = {c_alg}   // {bit_length}-bit vector",
+    "- h(x) = {h_alg}   // {h_bit_length}-bit irreducible polynomial",
+    "",
+    "Project structure:",
+    "```",
+    "    gf2_{e}_prng/",
+    "    ├── rtl/",
+    "    │   ├── src/       # Verilog modules",
+    "    │   └── tb/        # Testbenches",
+    "    ├── modelsim/      # Simulation scripts",
+    "    ├── LICENSE        # License file",
+    "    └── README.md      # Project details",
+    "```",
+    "",
+))
+
+SRC_TEMPLATE = "\n".join((
+    "// ============================================================================== ",
+    "// Pseudorandom Number Generator (PRNG) over GF(2^{e})                             ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                    ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE              ",
+    "//                                                                                 ",
+    "// Implements a PRNG based on the affine recurrence relation:                     ",
+    "//                                                                                 ",
+    "//     x_{{n+1}}(x) = a(x)·x_n(x) + c(x) mod h(x)                                    ",
+    "//                                                                                 ",
+    "// All polynomials have binary coefficients (0 or 1). The recurrence operates     ",
+    "// over the finite field GF(2^{e}), defined by the irreducible polynomial h(x).",
+    "//                                                                                 ",
+    "// Constant polynomials given as:                                                 ",
+    "//     - a(x) = {a_alg}   // {bit_length}-bit vector",
+    "//     - c(x) = {c_alg}   // {bit_length}-bit vector",
+    "//     - h(x) = {h_alg}   // {h_bit_length}-bit irreducible polynomial",
+    "//                                                                                 ",
+    "// INPUTS:                                                                         ",
+    "//     - clk       : Clock signal                                                  ",
+    "//     - rst       : Synchronous active-high reset                                 ",
+    "//     - enable    : When high, triggers the generation of the next PRNG value     ",
+    "//     - seed      : Initial value x_0 ({bit_length}-bit input vector)              ",
+    "//                                                                                 ",
+    "// OUTPUT:                                                                         ",
+    "//     - prng_out  : Pseudorandom output ({bit_length}-bit output vector)         ",
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - All arithmetic is performed over GF(2), with reduction modulo h(x).      ",
+    "// ============================================================================== ",
+    "",
+    # Module declaration
+    "module gf2_{e}_prng (",
+    "    input  wire              clk,",
+    "    input  wire              rst,        // Reset signal (active high)",
+    "    input  wire              enable,     // Enable signal for updating state",
+    "    input  wire [{bit_length}-1:0]     seed,       // Initial polynomial/condition",
+    "    output wire [{bit_length}-1:0]     prng_out    // Output of current PRNG state",
+    ");",
+    "",
+    # Declare regs and wires
+    "    // Internal state register holds current PRNG state",
+    "    reg [{bit_length}-1:0] state;",
+    "",
+    "    // Wire to hold next PRNG state after applying recurrence",
+    "    wire [{bit_length}-1:0] next_state;",
+    "",
+    # Declare module that computes a(x)x_n(x) + c(x)(mod h(x))
+    "    // Declare module that computes recurrence relation in GF(2^{bit_length})",
+    "    gf2_poly_affine_mod_{bit_length} GF2_POLY_AFFINE_MOD_{bit_length} (",
+    "        .in_poly(state),",
+    "        .out_poly(next_state)",
+    "    );",
+    "",
+    # PRNG update output logic
+    "    // PRNG state update logic",
+    "    always @(posedge clk) begin",
+    "        if (rst)",
+    "            state <= seed;                  // Load seed on reset",
+    "        else if (enable)",
+    "            state <= next_state;            // Update state only when enabled",
+    "    end",
+    "",
+    # Assign PRNG output
+    "    // Assign PRNG output",
+    "    assign prng_out = state;",
+    "",
+    "endmodule",
+))
+
+TB_TEMPLATE = "\n".join((
+    "// ============================================================================== ",
+    "// Testbench for Pseudorandom Number Generator (PRNG) over GF(2^{e})              ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                    ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE              ",
+    "//                                                                                 ",
+    "// Testbench for gf2_{e}_prng.v                                        ",
+    "//                                                                                 ",
+    "// FUNCTIONALITY:                                                                  ",
+    "//    - Instantiates the PRNG module defined over GF(2^{e})                       ",
+    "//     - Uses the affine recurrence relation:                                     ",
+    "//                                                                                 ",
+    "//           x_{{n+1}}(x) = a(x)·x_n(x) + c(x) mod h(x)                              ",
+    "//                                                                                 ",
+    "//     - Simulates PRNG behavior for a random input seed                          ",
+    "//     - Iterate PRNG 100 times                                                   ",
+    "//     - Compares PRNG output with a reference software model                     ",
+    "//                                                                                 ",
+    "// PARAMETERS:                                                                     ",
+    "//         - Polynomial a(x) : {a_alg}   // {bit_length}-bit vector ",
+    "//         - Polynomial c(x) : {c_alg}   // {bit_length}-bit vector ",
+    "//         - Modulus polynomial h(x): {h_alg}   // {h_bit_length}-bit irreducible polynomial",
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - All polynomials are over GF(2)                                            ",
+    "//     - This testbench can be extended to perform automated checking              ",
+    "// ============================================================================== ",
+    "",
+    "`timescale 1ns/1ps",
+    "",
+    # Module declaration
+    "module tb_gf2_{e}_prng;",
+    "",
+    # Declare regs and wires
+    "    // Declare regs and wires",
+    "    reg                    clk;",
+    "    reg                    rst;",
+    "    reg                    enable;",
+    "    reg  [{bit_length}-1:0] seed;",
+    "    wire [{bit_length}-1:0] prng_out;",
+    "",
+    "    // Declare integer i used to iterate over the PRNG",
+    "    integer                    i;",
+    # Declare PRNG module
+    "    // Declare PRNG module",
+    "    gf2_{e}_prng DUT (",
+    "        .clk       (clk),",
+    "        .rst       (rst),",
+    "        .enable    (enable),",
+    "        .seed      (seed),",
+    "        .prng_out  (prng_out)",
+    "    );",
+    "",
+    # Create clock logic
+    "    always #5 clk = ~clk;",
+    # Testing
+    "    initial begin",
+    "        clk = 1'b0;",
+    "        rst = 1'b0;",
+    "        enable = 1'b0;",
+    "        seed = {bit_length}'d{code_input};",
+    "",
+    "        #10",
+    "        rst = 1'b1;",
+    "",
+    "        #10",
+    "        rst = 1'b0;",
+    "        enable = 1'b1;",
+    "",
+    "        // Iterate the PRNG 100 times",
+    "        i = 0;",
+    "        repeat (100) begin",
+    "            @(posedge clk);",
+    "            i = i + 1;",
+    "        end",
+    "",
+    "        #10",
+    "        // Compare PRNG output with computation done by software",
+    "        if (prng_out == {bit_length}'d{expected_code_output})",
+    "            $display(\"Test Passed --> tb_gf2_{e}_prng\");",
+    "        else",
+    "            $display(\"Test Failed --> tb_gf2_{e}_prng\");",
+    "",
+    "        $stop;",
+    "    end",
+    "",
+    "endmodule",
+))
+
+def ensure_dir(path: str) -> None:
+    """
+    Create directory path (and its parents) if needed
+    Directories already created by this process only cost a single isdir check
+    """
+    path = os.path.abspath(path)
+    if path in CREATED_DIRS and os.path.isdir(path):
+        return
+    os.makedirs(path, exist_ok=True)
+    CREATED_DIRS.add(path)
+
+def write_text_file(path: str, text: str) -> None:
+    """
+    Write text to path (created or truncated), encoded once and handed to the OS with
+    os.write, instead of going through a text-mode file object and its buffers
+    """
+    data = memoryview(text.encode(WRITE_ENCODING))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        # os.write may write less than asked for, so keep going until all bytes are out
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def write_text_file_if_changed(path: str, text: str) -> bool:
+    """
+    Write text to path with write_text_file, unless path already holds exactly that text
+    Leaving an identical file alone saves the write and keeps its timestamp, so tools
+    watching the file (simulators, build systems) do not see a change
+    Only used for the README and the top-level PRNG source and testbench: the submodule
+    generators (affine, affine-mod, mod, xor_tree) always rewrite their files
+    Returns whether the file was written
+    """
+    data = text.encode(WRITE_ENCODING)
+    try:
+        # A different size already means different contents, so most changes skip the read
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    write_text_file(path, text)
+    return True
+
+def copy_file(src_path: str, dst_path: str, src_stat: os.stat_result) -> None:
+    """
+    Copy a regular file and its permission bits and timestamps, given its (already known) stat
+    The bytes are copied by the kernel with os.sendfile where available (see USE_SENDFILE),
+    falling back to a buffered copy if the first os.sendfile call fails
+    """
+    src_fd = os.open(src_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            use_sendfile = USE_SENDFILE
+            offset = 0
+            while use_sendfile and offset < src_stat.st_size:
+                try:
+                    sent = os.sendfile(dst_fd, src_fd, offset, src_stat.st_size - offset)
+                except OSError:
+                    # Nothing was copied yet (e.g. a filesystem without sendfile support),
+                    # so copy it all with the fallback instead, as shutil does
+                    if offset:
+                        raise
+                    use_sendfile = False
+                    break
+                if sent == 0:
+                    break
+                offset += sent
+            if not use_sendfile:
+                with os.fdopen(src_fd, "rb", closefd=False) as src, os.fdopen(dst_fd, "wb", closefd=False) as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    # Same metadata as shutil.copy2, from the stat result instead of another stat call
+    os.chmod(dst_path, src_stat.st_mode & 0o7777)
+    os.utime(dst_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+def copy_tree(src_dir: str, dst_dir: str) -> None:
+    """
+    Recursively copy src_dir into dst_dir (merging with existing contents, like
+    shutil.copytree with dirs_exist_ok=True), scanning each directory once with os.scandir
+    and reusing each entry's stat result
+    """
+    ensure_dir(dst_dir)
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            dst_path = f"{dst_dir}/{entry.name}"
+            if entry.is_dir():
+                copy_tree(entry.path, dst_path)
+            else:
+                copy_file(entry.path, dst_path, entry.stat())
 
 def create_modelsim_dir(project_dir: str) -> None:
     """
     Copy the base modelsim dir to the project directory
     """
-    # Absolute path to the dir containing this script 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # Absolute path to the base modelsim dir
-    modelsim_dir = os.path.abspath(os.path.join(script_dir, "..", "modelsim"))
-
     # Absolute path to the destination project dir
     project_dir = os.path.abspath(project_dir)
 
     # Make sure destination project directory exists
-    os.makedirs(project_dir, exist_ok=True)
+    ensure_dir(project_dir)
 
     # Construct the modelsim dir inside destination project dir
-    dest_modelsim_dir = os.path.join(project_dir, "modelsim")
+    dest_modelsim_dir = f"{project_dir}/modelsim"
 
     # Copy modelsim dir files
-    shutil.copytree(modelsim_dir, dest_modelsim_dir, dirs_exist_ok=True)
+    copy_tree(BASE_MODELSIM_DIR, dest_modelsim_dir)
     # print(f"Copied {modelsim_dir} -> {dest_modelsim_dir}")
 
     return
@@ -107,348 +419,143 @@ def copy_license(project_dir: str) -> None:
     """
     Copy LICENSE file to project directory
     """
-
-    # Absolute path to the dir containing this script 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # Absolute path to the base LICENSE file
-    license_file_path = os.path.abspath(os.path.join(script_dir, "..", "LICENSE"))
-
     # Absolute path to the destination project dir
     project_dir = os.path.abspath(project_dir)
 
     # Make sure destination project directory exists
-    os.makedirs(project_dir, exist_ok=True)
+    ensure_dir(project_dir)
 
-    # Copy the LICENSE file
-    shutil.copy(license_file_path, project_dir)
+    # Copy the LICENSE file (a copy, not a hard link, so editing the project's LICENSE
+    # can never change this repository's)
+    copy_file(LICENSE_PATH, f"{project_dir}/LICENSE", os.stat(LICENSE_PATH))
 
     return
 
-def create_readme(a: int, c: int, h: int, project_dir: str) -> None:
+def create_readme(a: int, c: int, h: int, e: int, project_dir: str) -> str:
     """
     Create README.md for created project in the project directory 
+    e is the degree of h(x), i.e., the finite field is GF(2^e)
+    Returns the README text (the same string that was written)
     """
-    # Get finite field GF(2^e) order
-    e = bit_length = poly_degree(h)
-
-    lines = []
-    # Header
-    lines.append(f"# Pseudorandom Number Generator (PRNG) over GF(2^{e})")
-    lines.append("")
-    lines.append("Author      : Davi Moreno")
-    lines.append("Affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE")
-    lines.append("")
-    lines.append("Implements a PRNG based on the affine recurrence relation:")
-    lines.append("```")
-    lines.append("    x_{n+1}(x) = a(x)·x_n(x) + c(x) mod h(x)")
-    lines.append("```")
-    lines.append("All polynomials have binary coefficients (0 or 1). The recurrence operates")
-    lines.append(f"over the finite field GF(2^{e}), defined by the irreducible polynomial h(x).")
-    lines.append("")
-    lines.append("Constant polynomials given as:")
-    lines.append(f"- a(x) = {int_poly_to_str(a, 'alg')}   // {bit_length}-bit vector") 
-    lines.append(f"- c(x) = {int_poly_to_str(c, 'alg')}   // {bit_length}-bit vector") 
-    lines.append(f"- h(x) = {int_poly_to_str(h, 'alg')}   // {bit_length + 1}-bit irreducible polynomial")
-    lines.append("")
-    lines.append("Project structure:")
-    lines.append("```")
-    lines.append(f"    gf2_{e}_prng/")
-    lines.append("    ├── rtl/")
-    lines.append("    │   ├── src/       # Verilog modules")
-    lines.append("    │   └── tb/        # Testbenches")
-    lines.append("    ├── modelsim/      # Simulation scripts")
-    lines.append("    ├── LICENSE        # License file")
-    lines.append("    └── README.md      # Project details")
-    lines.append("```")
-    lines.append("")
-
-    readme_text = "\n".join(lines)
+    readme_text = README_TEMPLATE.format(
+        e=e,
+        bit_length=e,
+        h_bit_length=e + 1,
+        a_alg=int_poly_to_str(a, 'alg'),
+        c_alg=int_poly_to_str(c, 'alg'),
+        h_alg=int_poly_to_str(h, 'alg'),
+    )
 
     # Absolute path to the destination project dir
     project_dir = os.path.abspath(project_dir)
 
     # Make sure destination project directory exists
-    os.makedirs(project_dir, exist_ok=True)
+    ensure_dir(project_dir)
 
     # Save README.md file
-    path_out_filename = os.path.join(project_dir, "README.md")
-    with open(path_out_filename, "w") as f:
-        f.write(readme_text)
+    path_out_filename = f"{project_dir}/README.md"
+    write_text_file_if_changed(path_out_filename, readme_text)
     # print(f"README generated in {path_out_filename}")
 
-    return "\n".join(lines)
+    return readme_text
 
-def generate_src(a: int, c: int, h: int) -> str:
+def generate_src(a: int, c: int, h: int, e: int) -> str:
     """
     Generate main module verilog code
+    e is the degree of h(x), i.e., the bit length of the elements in GF(2^e)
     """
-    # Compute the bit length of the elements in the GF(2^e), defined by the irreducible polynomial h(x)
-    e = bit_length = poly_degree(h)
-
-    lines = []
-
-    # Header
-    lines.append("// ============================================================================== ")
-    lines.append(f"// Pseudorandom Number Generator (PRNG) over GF(2^{e})                             ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                    ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE              ")
-    lines.append("//                                                                                 ")
-    lines.append("// Implements a PRNG based on the affine recurrence relation:                     ")
-    lines.append("//                                                                                 ")
-    lines.append("//     x_{n+1}(x) = a(x)·x_n(x) + c(x) mod h(x)                                    ")
-    lines.append("//                                                                                 ")
-    lines.append("// All polynomials have binary coefficients (0 or 1). The recurrence operates     ")
-    lines.append(f"// over the finite field GF(2^{e}), defined by the irreducible polynomial h(x).")
-    lines.append("//                                                                                 ")
-    lines.append("// Constant polynomials given as:                                                 ")
-    lines.append(f"//     - a(x) = {int_poly_to_str(a, 'alg')}   // {bit_length}-bit vector") 
-    lines.append(f"//     - c(x) = {int_poly_to_str(c, 'alg')}   // {bit_length}-bit vector") 
-    lines.append(f"//     - h(x) = {int_poly_to_str(h, 'alg')}   // {bit_length + 1}-bit irreducible polynomial")
-    lines.append("//                                                                                 ")
-    lines.append("// INPUTS:                                                                         ")
-    lines.append("//     - clk       : Clock signal                                                  ")
-    lines.append("//     - rst       : Synchronous active-high reset                                 ")
-    lines.append("//     - enable    : When high, triggers the generation of the next PRNG value     ")
-    lines.append(f"//     - seed      : Initial value x_0 ({bit_length}-bit input vector)              ")
-    lines.append("//                                                                                 ")
-    lines.append("// OUTPUT:                                                                         ")
-    lines.append(f"//     - prng_out  : Pseudorandom output ({bit_length}-bit output vector)         ")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - All arithmetic is performed over GF(2), with reduction modulo h(x).      ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    # Module declaration
-    lines.append(f"module gf2_{e}_prng (")
-    lines.append("    input  wire              clk,")
-    lines.append("    input  wire              rst,        // Reset signal (active high)")
-    lines.append("    input  wire              enable,     // Enable signal for updating state")
-    lines.append(f"    input  wire [{bit_length}-1:0]     seed,       // Initial polynomial/condition")
-    lines.append(f"    output wire [{bit_length}-1:0]     prng_out    // Output of current PRNG state")
-    lines.append(");")
-    lines.append("")
-
-    # Declare regs and wires
-    lines.append(f"    // Internal state register holds current PRNG state")
-    lines.append(f"    reg [{bit_length}-1:0] state;")
-    lines.append("")
-    lines.append(f"    // Wire to hold next PRNG state after applying recurrence")
-    lines.append(f"    wire [{bit_length}-1:0] next_state;")
-    lines.append("")
-
-    # Declare module that computes a(x)x_n(x) + c(x)(mod h(x))
-    lines.append(f"    // Declare module that computes recurrence relation in GF(2^{bit_length})")
-    lines.append(f"    gf2_poly_affine_mod_{bit_length} GF2_POLY_AFFINE_MOD_{bit_length} (")
-    lines.append(f"        .in_poly(state),")
-    lines.append(f"        .out_poly(next_state)")
-    lines.append(f"    );")
-    lines.append("")
-
-    # PRNG update output logic
-    lines.append(f"    // PRNG state update logic")
-    lines.append(f"    always @(posedge clk) begin")
-    lines.append(f"        if (rst)")
-    lines.append(f"            state <= seed;                  // Load seed on reset")
-    lines.append(f"        else if (enable)")
-    lines.append(f"            state <= next_state;            // Update state only when enabled")
-    lines.append(f"    end")
-    lines.append("")
-
-    # Assign PRNG output
-    lines.append(f"    // Assign PRNG output")
-    lines.append(f"    assign prng_out = state;")
-    lines.append("")
-
-    lines.append("endmodule")
-
-    return "\n".join(lines)
+    return SRC_TEMPLATE.format(
+        e=e,
+        bit_length=e,
+        h_bit_length=e + 1,
+        a_alg=int_poly_to_str(a, 'alg'),
+        c_alg=int_poly_to_str(c, 'alg'),
+        h_alg=int_poly_to_str(h, 'alg'),
+    )
 
 def generate_random_integers(num_vectors, bit_length, seed=42):
     """
     Generates num_vectors random integers with at most bit_length bits each
+
+    Uses its own seeded random.Random instance, so the global random state is left untouched
     """
-    random.seed(seed)
-    max_val = 2**bit_length - 1
-    return [random.randint(0, max_val) for _ in range(num_vectors)]
+    getrandbits = random.Random(seed).getrandbits
+    return [getrandbits(bit_length) for _ in range(num_vectors)]
 
-def random_computation_example(a, c, h, seed=42):
+@functools.lru_cache(maxsize=32)
+def random_computation_example(a, c, h, bit_length, seed=42):
     """
     Generate computation example for some random input 
+    Cached, so generating the same PRNG again (e.g. from the GUI) reuses the example
     """
-    # Compute input bit length
-    bit_length = poly_degree(h)
-    
     # Generate random input
     code_input = generate_random_integers(1, bit_length, seed=seed)[0]
 
-    # Iterate 100 times the PRNG
-    prng_in = code_input
-    for _ in range(100):
-        prng_out = poly_affine_mod(a, prng_in, c, h)
-        prng_in = prng_out
-
-    expected_code_output = prng_out
+    # Iterate 100 times the PRNG, jumping all steps at once
+    jump_a, jump_c = poly_affine_mod_jump(a, c, h, 100)
+    expected_code_output = poly_affine_mod(jump_a, code_input, jump_c, h)
 
     return code_input, expected_code_output
 
-def generate_tb(a: int, c: int, h: int) -> str:
+def generate_tb(a: int, c: int, h: int, e: int) -> str:
     """
     Generate module testbench code
+    e is the degree of h(x), i.e., the bit length of the elements in GF(2^e)
     """
-    # Compute the bit length of the elements in the GF(2^e), defined by the irreducible polynomial h(x)
-    e = bit_length = poly_degree(h)
-
     # Generate random test
-    code_input, expected_code_output = random_computation_example(a, c, h, seed=42)
-
-    lines = []
-
-    # Header
-    lines.append("// ============================================================================== ")
-    lines.append(f"// Testbench for Pseudorandom Number Generator (PRNG) over GF(2^{e})              ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                    ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE              ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Testbench for gf2_{e}_prng.v                                        ")
-    lines.append("//                                                                                 ")
-    lines.append("// FUNCTIONALITY:                                                                  ")
-    lines.append(f"//    - Instantiates the PRNG module defined over GF(2^{e})                       ")
-    lines.append("//     - Uses the affine recurrence relation:                                     ")
-    lines.append("//                                                                                 ")
-    lines.append("//           x_{n+1}(x) = a(x)·x_n(x) + c(x) mod h(x)                              ")
-    lines.append("//                                                                                 ")
-    lines.append("//     - Simulates PRNG behavior for a random input seed                          ")
-    lines.append("//     - Iterate PRNG 100 times                                                   ")
-    lines.append("//     - Compares PRNG output with a reference software model                     ")
-    lines.append("//                                                                                 ")
-    lines.append("// PARAMETERS:                                                                     ")
-    lines.append(f"//         - Polynomial a(x) : {int_poly_to_str(a, 'alg')}   // {bit_length}-bit vector ")
-    lines.append(f"//         - Polynomial c(x) : {int_poly_to_str(c, 'alg')}   // {bit_length}-bit vector ") 
-    lines.append(f"//         - Modulus polynomial h(x): {int_poly_to_str(h, 'alg')}   // {bit_length + 1}-bit irreducible polynomial")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - All polynomials are over GF(2)                                            ")
-    lines.append("//     - This testbench can be extended to perform automated checking              ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    lines.append("`timescale 1ns/1ps")
-    lines.append("")
-
-    # Module declaration
-    lines.append(f"module tb_gf2_{e}_prng;")
-    lines.append("")
-
-    # Declare regs and wires
-    lines.append(f"    // Declare regs and wires")
-    lines.append(f"    reg                    clk;")
-    lines.append(f"    reg                    rst;")
-    lines.append(f"    reg                    enable;")
-    lines.append(f"    reg  [{bit_length}-1:0] seed;")
-    lines.append(f"    wire [{bit_length}-1:0] prng_out;")
-    lines.append("")
-
-    lines.append(f"    // Declare integer i used to iterate over the PRNG")
-    lines.append(f"    integer                    i;")
-
-    # Declare PRNG module
-    lines.append(f"    // Declare PRNG module")
-    lines.append(f"    gf2_{e}_prng DUT (")
-    lines.append(f"        .clk       (clk),")
-    lines.append(f"        .rst       (rst),")
-    lines.append(f"        .enable    (enable),")
-    lines.append(f"        .seed      (seed),")
-    lines.append(f"        .prng_out  (prng_out)")
-    lines.append(f"    );")
-    lines.append("")
+    code_input, expected_code_output = random_computation_example(a, c, h, e, seed=42)
+
+    return TB_TEMPLATE.format(
+        e=e,
+        bit_length=e,
+        h_bit_length=e + 1,
+        a_alg=int_poly_to_str(a, 'alg'),
+        c_alg=int_poly_to_str(c, 'alg'),
+        h_alg=int_poly_to_str(h, 'alg'),
+        code_input=code_input,
+        expected_code_output=expected_code_output,
+    )
 
-    # Create clock logic
-    lines.append(f"    always #5 clk = ~clk;")
 
-    # Testing
-    lines.append("    initial begin")
-    lines.append(f"        clk = 1'b0;")
-    lines.append(f"        rst = 1'b0;")
-    lines.append(f"        enable = 1'b0;")
-    lines.append(f"        seed = {bit_length}'d{code_input};")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        rst = 1'b1;")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        rst = 1'b0;")
-    lines.append(f"        enable = 1'b1;")
-    lines.append("")
-    lines.append(f"        // Iterate the PRNG 100 times")
-    lines.append(f"        i = 0;")
-    lines.append(f"        repeat (100) begin")
-    lines.append(f"            @(posedge clk);")
-    lines.append(f"            i = i + 1;")
-    lines.append(f"        end")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        // Compare PRNG output with computation done by software")
-    lines.append(f"        if (prng_out == {bit_length}'d{expected_code_output})")
-    lines.append(f"            $display(\"Test Passed --> tb_gf2_{e}_prng\");")
-    lines.append("        else")
-    lines.append(f"            $display(\"Test Failed --> tb_gf2_{e}_prng\");")
-    lines.append("")
-    lines.append("        $stop;")
-    lines.append("    end")
-    lines.append("")
-    lines.append("endmodule")
-
-    return "\n".join(lines)
-
-
-def generate_submodules_verilog_and_tb_to_files(a: int, c: int, h: int, save_dir: str) -> None:
+def generate_submodules_verilog_and_tb_to_files(a: int, c: int, h: int, e: int, save_dir: str) -> None:
     """
     Generate submodules needed for this code to run:
         - gf2_poly_affine_mod
     """
 
-    # Compute parameters needed to generate gf2_poly_affine_mod
-    bit_length = poly_degree(h)
-
-    # Generate submodules
-    gf2_poly_affine_mod_generator.generate_verilog_and_tb_to_files(a, c, h, bit_length, save_dir)
+    # Generate submodules (the affine mod inputs are elements of GF(2^e), so e bits wide)
+    gf2_poly_affine_mod_generator.generate_verilog_and_tb_to_files(a, c, h, e, save_dir)
 
     return
 
-def generate_verilog_and_tb_to_files(a: int, c: int, h: int, save_dir: str) -> None:
+def generate_verilog_and_tb_to_files(a: int, c: int, h: int, e: int, save_dir: str) -> None:
     """
     Generate verilog and testbench files and save them inside save_dir
+    e is the degree of h(x), i.e., the finite field is GF(2^e)
     """
     # Generate and save submodule src and tb files
-    generate_submodules_verilog_and_tb_to_files(a, c, h, save_dir)
+    generate_submodules_verilog_and_tb_to_files(a, c, h, e, save_dir)
 
     # Create directory to put src and tb files
-    src_dir = save_dir + "/src"
-    tb_dir = save_dir + "/tb"
-    os.makedirs(src_dir, exist_ok=True)
-    os.makedirs(tb_dir, exist_ok=True)
+    src_dir = f"{save_dir}/src"
+    tb_dir = f"{save_dir}/tb"
+    ensure_dir(src_dir)
+    ensure_dir(tb_dir)
 
     # Set files path
-    e = poly_degree(h)
     out_filename = f"gf2_{e}_prng.v"
-    out_tb_filename = "tb_" + out_filename
-    path_out_filename = src_dir + "/" + out_filename
-    path_out_tb_filename = tb_dir + "/" + out_tb_filename
+    out_tb_filename = f"tb_{out_filename}"
+    path_out_filename = f"{src_dir}/{out_filename}"
+    path_out_tb_filename = f"{tb_dir}/{out_tb_filename}"
 
     # Generate and save verilog code
-    verilog_code = generate_src(a, c, h)
-    with open(path_out_filename, "w") as f:
-        f.write(verilog_code)
+    verilog_code = generate_src(a, c, h, e)
+    write_text_file_if_changed(path_out_filename, verilog_code)
     print(f"Verilog generated in {path_out_filename}")
 
     # Generate and save tb files
-    verilog_tb_code = generate_tb(a, c, h)
-    with open(path_out_tb_filename, "w") as f:
-        f.write(verilog_tb_code)
+    verilog_tb_code = generate_tb(a, c, h, e)
+    write_text_file_if_changed(path_out_tb_filename, verilog_tb_code)
     print(f"Verilog testbench generated in {path_out_tb_filename}")
 
 def generate_project(a: int, c: int, h: int, save_dir: str) -> None:
@@ -457,23 +564,25 @@ def generate_project(a: int, c: int, h: int, save_dir: str) -> None:
     Create subdir rtl with all src and tb files
     Create subdir modelsim with simulation files
     """
-    # Create project directory
+    # Get finite field GF(2^e) order, once for every step below
     e = poly_degree(h)
-    project_dir = save_dir + f"/gf2_{e}_prng"
-    os.makedirs(project_dir, exist_ok=True)
+
+    # Create project directory
+    project_dir = f"{save_dir}/gf2_{e}_prng"
+    ensure_dir(project_dir)
 
     # Create RTL directory to save src and tb files
-    rtl_dir = project_dir + "/rtl"
-    os.makedirs(rtl_dir, exist_ok=True)
+    rtl_dir = f"{project_dir}/rtl"
+    ensure_dir(rtl_dir)
 
     # Generate project src and tb files inside rtl_dir
-    generate_verilog_and_tb_to_files(a, c, h, rtl_dir)
+    generate_verilog_and_tb_to_files(a, c, h, e, rtl_dir)
 
     # Copy base modelsim dir to project_dir to help with simulation
     create_modelsim_dir(project_dir)
 
     # Add README.md to project
-    create_readme(a, c, h, project_dir)
+    create_readme(a, c, h, e, project_dir)
 
     # Copy LICENSE file to project
     copy_license(project_dir)
@@ -498,31 +607,32 @@ def positive_int(value):
         raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
     return ivalue
 
+# Command line help text shown by argument_parser
+DESCRIPTION = (
+    "  ___ ___ ___ ___   ___ ___ _  _  ___   _____ ___   ___  _    \n"
+    " / __| __|_  ) __| | _ \\ _ \\ \\| |/ __| |_   _/ _ \\ / _ \\| |   \n"
+    "| (_ | _| / /| _|  |  _/   / .` | (_ |   | || (_) | (_) | |__ \n"
+    " \\___|_| /___|___| |_| |_|_\\_|\\_|\\___|   |_| \\___/ \\___/|____|\n"
+    "                   by Davi Moreno (@davimoreno)\n\n"
+    "Generate Verilog code and a corresponding testbench for a Pseudorandom Number "
+    "Generator (PRNG) based on an affine recurrence relation over GF(2^e), defined by\n\n"
+    "x_{n+1}(x) = a(x)x_n(x) + c(x) mod h(x).\n\nThe irreducible polynomial h(x) defines "
+    "the extension field GF(2^e), and the constants a(x) and c(x) are binary polynomials "
+    "represented as integers.\n\nAll generated files will be saved inside the directory "
+    "gf2_{e}_prng, including:\n"
+    "    - README.md                       : Project details\n"
+    "    - LICENSE                         : License file\n"
+    "    - modelsim/                       : ModelSim simulation scripts\n"
+    "    - rtl/src/gf2_{e}_prng.v          : Verilog PRNG module file\n"
+    "    - rtl/tb/tb_gf2_{e}_prng.v        : Verilog PRNG testbench file\n"
+    "    - Necessary submodules and their testbenches inside rtl/src/ and rtl/tb/\n"
+)
+
 def argument_parser():
     """
     Parse command line arguments
     """
-    description = (
-        "  ___ ___ ___ ___   ___ ___ _  _  ___   _____ ___   ___  _    \n"
-        " / __| __|_  ) __| | _ \\ _ \\ \\| |/ __| |_   _/ _ \\ / _ \\| |   \n"
-        "| (_ | _| / /| _|  |  _/   / .` | (_ |   | || (_) | (_) | |__ \n"
-        " \\___|_| /___|___| |_| |_|_\\_|\\_|\\___|   |_| \\___/ \\___/|____|\n"
-        "                   by Davi Moreno (@davimoreno)\n\n"
-        "Generate Verilog code and a corresponding testbench for a Pseudorandom Number "
-        "Generator (PRNG) based on an affine recurrence relation over GF(2^e), defined by\n\n"
-        "x_{n+1}(x) = a(x)x_n(x) + c(x) mod h(x).\n\nThe irreducible polynomial h(x) defines "
-        "the extension field GF(2^e), and the constants a(x) and c(x) are binary polynomials "
-        "represented as integers.\n\nAll generated files will be saved inside the directory "
-        "gf2_{e}_prng, including:\n"
-        "    - README.md                       : Project details\n"
-        "    - LICENSE                         : License file\n"
-        "    - modelsim/                       : ModelSim simulation scripts\n"
-        "    - rtl/src/gf2_{e}_prng.v          : Verilog PRNG module file\n"
-        "    - rtl/tb/tb_gf2_{e}_prng.v        : Verilog PRNG testbench file\n"
-        "    - Necessary submodules and their testbenches inside rtl/src/ and rtl/tb/\n"
-    )
-
-    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawTextHelpFormatter)
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument("a", type=positive_int, help="Polynomial a(x) (positive integer)")
     parser.add_argument("c", type=nonnegative_int, help="Polynomial c(x) (nonnegative integer)")
     parser.add_argument("h", type=positive_int, help="Irreducible polynomial h(x) (positive integer)")
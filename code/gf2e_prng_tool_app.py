@@ -20,28 +20,68 @@
 # ===============================================================================
 
 from tkinter import ttk, filedialog, messagebox
-from gf2_poly_utils import poly_degree, poly_mod, str_poly_to_int, int_poly_to_str
+from gf2_poly_utils import poly_degree, poly_is_irreducible, poly_mod, str_poly_to_int, int_poly_to_str
 
 import gf2e_prng_tool
 import os
+import queue
 import sys
 import tkinter as tk
 import traceback
 
+# Interval (in ms) between checks for pending writes to the Console logs, so bursts of
+# small writes (e.g. a traceback) are inserted together
+CONSOLE_POLL_INTERVAL_MS = 50
+
+# Maximum number of lines kept in the Console logs (the oldest lines are dropped), so the
+# Text widget, and inserting into or clearing it, stays fast however long the app runs
+CONSOLE_MAX_LINES = 5000
+
+def trim_console_lines(text_widget):
+    """
+    Delete the oldest lines of the Console logs Text widget, keeping the last CONSOLE_MAX_LINES
+    The widget must be in the "normal" state
+    """
+    num_lines = int(text_widget.index("end-1c").split(".")[0])
+    if num_lines > CONSOLE_MAX_LINES:
+        text_widget.delete("1.0", f"{num_lines - CONSOLE_MAX_LINES + 1}.0")
+
 class ConsoleRedirector:
     """
     Used to redirect stdout/stderr to the app Console logs
+    Writes only put the message in a queue, so they are safe from any thread (Tk is not).
+    The main thread drains the queue every CONSOLE_POLL_INTERVAL_MS and shows the pending
+    writes in a single insert, instead of toggling the Text widget state and scrolling once
+    per write
     """
     def __init__(self, text_widget):
         self.text_widget = text_widget
+        self.pending_messages = queue.Queue()
+        self.text_widget.after(CONSOLE_POLL_INTERVAL_MS, self._drain_pending)
 
     def write(self, message):
+        self.pending_messages.put(message)
+
+    def _drain_pending(self):
+        self.text_widget.after(CONSOLE_POLL_INTERVAL_MS, self._drain_pending)
+        messages = []
+        try:
+            while True:
+                messages.append(self.pending_messages.get_nowait())
+        except queue.Empty:
+            pass
+        if not messages:
+            return
+        text = "".join(messages)
+
         self.text_widget.config(state="normal")
-        self.text_widget.insert("end", message)
+        self.text_widget.insert("end", text)
+        trim_console_lines(self.text_widget)
         self.text_widget.see("end")
         self.text_widget.config(state="disabled")
 
     def flush(self):
+        # Pending writes are shown by the polling _drain_pending
         pass
 
 class VerilogGeneratorGUI(tk.Tk):
@@ -73,6 +113,9 @@ class VerilogGeneratorGUI(tk.Tk):
 
         self.entries = {}
         self.format_vars = {}
+        # Whether each entry is showing its placeholder (kept here, so it is known without
+        # asking Tk for the entry's foreground color)
+        self.is_placeholder = {}
 
         for idx, label in enumerate(["a(x)", "c(x)", "h(x)"]):
             ttk.Label(frame, text=f"Polynomial {label}:").grid(row=idx, column=0, sticky="w")
@@ -81,10 +124,7 @@ class VerilogGeneratorGUI(tk.Tk):
             format_var = tk.StringVar(value="int")
             self.format_vars[label] = format_var
 
-            format_menu = ttk.OptionMenu(
-                frame, format_var, "int", *self.format_options,
-                command=lambda fmt, l=label: self._update_placeholder(l, fmt)
-            )
+            format_menu = ttk.OptionMenu(frame, format_var, "int", *self.format_options)
             format_menu.grid(row=idx, column=1, sticky="w", padx=5)
 
             # Entry with simulated placeholder
@@ -96,6 +136,11 @@ class VerilogGeneratorGUI(tk.Tk):
             entry.bind("<FocusOut>", lambda e, l=label: self._restore_placeholder(l))
             entry.grid(row=idx, column=2, pady=5)
             self.entries[label] = entry
+            self.is_placeholder[label] = True
+
+            # Update the placeholder whenever the format changes (added once the entry
+            # exists, since OptionMenu already writes its default value to format_var)
+            format_var.trace_add("write", lambda *_, l=label: self._on_format_change(l))
 
         # Output directory
         ttk.Label(frame, text="Output Directory:").grid(row=3, column=0, sticky="w")
@@ -139,18 +184,23 @@ class VerilogGeneratorGUI(tk.Tk):
         self.output_text.config(state="disabled")
 
 
+    def _on_format_change(self, label):
+        self._update_placeholder(label, self.format_vars[label].get())
+
     def _update_placeholder(self, label, fmt):
         entry = self.entries[label]
-        if entry.get() == "" or entry.cget("foreground") == "gray":
+        if self.is_placeholder[label] or entry.get() == "":
             entry.delete(0, tk.END)
             entry.insert(0, self.placeholders[fmt])
             entry.config(foreground="gray")
+            self.is_placeholder[label] = True
 
     def _clear_placeholder(self, label):
         entry = self.entries[label]
-        if entry.cget("foreground") == "gray":
+        if self.is_placeholder[label]:
             entry.delete(0, tk.END)
             entry.config(foreground="black")
+            self.is_placeholder[label] = False
 
     def _restore_placeholder(self, label):
         entry = self.entries[label]
@@ -158,6 +208,7 @@ class VerilogGeneratorGUI(tk.Tk):
             fmt = self.format_vars[label].get()
             entry.insert(0, self.placeholders[fmt])
             entry.config(foreground="gray")
+            self.is_placeholder[label] = True
 
     def clear_output(self):
         """
@@ -174,6 +225,7 @@ class VerilogGeneratorGUI(tk.Tk):
         """
         self.output_text.config(state="normal")
         self.output_text.insert(tk.END, message + "\n")
+        trim_console_lines(self.output_text)
         self.output_text.see(tk.END)  # auto-scroll to bottom
         self.output_text.config(state="disabled")
 
@@ -192,7 +244,7 @@ class VerilogGeneratorGUI(tk.Tk):
         inputs = {}
         for label in ["a(x)", "c(x)", "h(x)"]:
             value = self.entries[label].get()
-            is_placeholder = self.entries[label].cget("foreground") == "gray"
+            is_placeholder = self.is_placeholder[label]
             poly_format = self.format_vars[label].get()
             inputs[label] = ("" if is_placeholder else value, poly_format)
             if is_placeholder:
@@ -222,10 +274,10 @@ class VerilogGeneratorGUI(tk.Tk):
         h = str_poly_to_int(poly_str=inputs["h(x)"][0], poly_format=inputs["h(x)"][1])
         save_dir = directory
 
-        # Check if h(x) is irreducible
-        # For now just checking that it is not 0
-        if h == 0:
-            messagebox.showinfo("Error", f"Polynomial h(x) cannot be {h}, it needs to be irreducible!")
+        # Check if h(x) is irreducible (Rabin's test), before any file is generated
+        if not poly_is_irreducible(h):
+            messagebox.showinfo("Error", f"Polynomial h(x) = {int_poly_to_str(h, 'alg')} is not irreducible!")
+            return
 
         # Reduce polynomials a(x) and c(x) by h(x) if possible (reducing by h(x) doesn't affect PRNG)
         a = poly_mod(a, h)
@@ -4,7 +4,8 @@
 # Python code that implements a PRNG based on a recurrence relation over GF(2^e)
 # Recurrence relation: x_{n+1} = (a(x) * x_n + c(x))(mod h(x)) 
 
-import galois
+from gf2_poly_utils import poly_affine_mod_stream, str_poly_to_int
+
 import random
 
 def generate_random_integer(min_val, max_val, seed=42):
@@ -22,21 +23,17 @@ def main():
     # x0 = generate_random_integer(0, order-1) # initial condition
     x0 = 478163327
 
-    # Creating GF(2^e)
-    GF = galois.GF(order, irreducible_poly=hx)
-    
-    # Converting parameters to elements in GF
-    ax = GF(ax)
-    cx = GF(cx)
-    x0 = GF(x0)
+    # Converting parameters to polynomials over GF(2) (as integers), elements of GF(2^e)
+    # when reduced by h(x)
+    ax = str_poly_to_int(ax, "alg")
+    cx = str_poly_to_int(cx, "alg")
+    hx = str_poly_to_int(hx, "alg")
 
-    # Iterating 100 times the PRNG
-    x = x0
+    # Iterating 100 times the PRNG, all states computed by a single call (the step loop
+    # runs inside poly_affine_mod_stream, with no per-step field element dispatch)
     print(f"Initial Cond. : {x0}")
-    for i in range(100):
-        x = ax * x + cx
-        prng_out = x
+    for i, prng_out in enumerate(poly_affine_mod_stream(ax, cx, hx, x0, 100)):
         print(f"i: {i}, prng_out: {prng_out}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -32,6 +32,8 @@
 #     - num_vectors  : Number of input vectors (positive integer)
 #     - bit_length   : Length in bits of each vector (positive integer)
 #     - -d, --dir    : Optional output directory (default: current directory)
+#     - --reduce     : Optional, write the XOR as a single expression instead of an
+#                      explicit tree of wires (the synthesis tool builds the tree)
 #
 #     Example usage:
 #         $ python3 xor_tree_generator.py 8 32 --dir ./output
@@ -45,107 +47,178 @@
 #     - Assumes inputs are stable during evaluation
 # ==============================================================================
 
+from pathlib import Path
+
 import argparse
+import io
 import os
 import random
 
-def generate_src(num_vectors, bit_length):
+# Buffer size used when writing generated files (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Encoding of generated files (fixed, so output does not depend on the platform's locale)
+WRITE_ENCODING = "utf-8"
+
+# Directories created by this process (see ensure_dir)
+CREATED_DIRS = set()
+
+# Per-node lines of the input unpacking (UNPACK_TEMPLATE) and of a tree stage
+# (XOR_NODE_TEMPLATE). The values that are constant along a loop are filled in once with
+# str.format, leaving a %-template for the node indices only (cheaper per node than an
+# f-string with every field)
+UNPACK_TEMPLATE = (
+    "    wire [{bit_length}-1:0] vec_0_%d;\n"
+    "    assign vec_0_%d = in_vectors[%d:%d];\n"
+)
+
+XOR_NODE_TEMPLATE = (
+    "    wire [{bit_length}-1:0] vec_{stage}_%d;\n"
+    "    assign vec_{stage}_%d = vec_{prev}_%d ^ vec_{prev}_%d;\n"
+)
+
+# Constant header lines of the generated module (SRC_HEADER, SRC_HEADER_NOTE) and
+# testbench (TB_HEADER, TB_HEADER_NOTE), around the lines that depend on the tree size
+SRC_HEADER = "\n".join((
+    "// ============================================================================== ",
+    "// Binary XOR Tree                                                                ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+    "// Computes the bitwise XOR of multiple binary vectors using a binary tree        ",
+)) + "\n"
+
+SRC_HEADER_NOTE = "\n".join((
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - The XOR operation is performed using a balanced binary tree to           ",
+    "//       minimize logic depth.                                                    ",
+    "// ============================================================================== ",
+    "",
+)) + "\n"
+
+# Same as SRC_HEADER_NOTE, for modules written with a single XOR expression (reduce=True)
+SRC_HEADER_NOTE_REDUCE = "\n".join((
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - The XOR operation is written as a single expression, and the synthesis   ",
+    "//       tool builds the balanced binary tree that minimizes logic depth.         ",
+    "// ============================================================================== ",
+    "",
+)) + "\n"
+
+TB_HEADER = "\n".join((
+    "// ============================================================================== ",
+    "// Testbench for Binary XOR Tree                                                  ",
+    "// ------------------------------------------------------------------------------ ",
+    "// @author      : Davi Moreno                                                     ",
+    "// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ",
+    "//                                                                                 ",
+)) + "\n"
+
+TB_HEADER_NOTE = "\n".join((
+    "//                                                                                 ",
+    "//     - Applies random input values to the design                                 ",
+    "//     - Computes the expected XOR result in simulation                            ",
+    "//     - Compares module output with expected result and reports mismatches        ",
+    "//                                                                                 ",
+    "// NOTE:                                                                           ",
+    "//     - This testbench is self-checking                                           ",
+    "//     - Simulation ends with a success or failure message                         ",
+    "// ============================================================================== ",
+    "",
+)) + "\n"
+
+def generate_src(num_vectors, bit_length, reduce=False, out=None):
     """
     Generate main module verilog code
+
+    If reduce is True, the output is written as a single XOR expression of all input
+    vectors (one line, no intermediate wires) and the synthesis tool builds the tree
+    If out (file-like object) is given, the code is written to it instead of being returned
     """
-    lines = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// Binary XOR Tree                                                                ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append("// Computes the bitwise XOR of multiple binary vectors using a binary tree        ")
-    lines.append(f"// structure. The module receives a single input vector composed of {num_vectors}")
-    lines.append(f"// concatenated {bit_length}-bit vectors (total of {num_vectors * bit_length} bits) and returns a {bit_length}-bit output")
-    lines.append("// representing their bitwise XOR.                                                ")
-    lines.append("//                                                                                 ")
-    lines.append("// INPUT:                                                                          ")
-    lines.append(f"//     - in_vectors : {num_vectors * bit_length}-bit input vector ({num_vectors} concatenated {bit_length}-bit binary vectors)")
-    lines.append("//                                                                                 ")
-    lines.append("// OUTPUT:                                                                         ")
-    lines.append(f"//     - out_xor    : {bit_length}-bit output vector (bitwise XOR of all {num_vectors} input vectors)")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - The XOR operation is performed using a balanced binary tree to           ")
-    lines.append("//       minimize logic depth.                                                    ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
+    w(SRC_HEADER)
+    w(f"// structure. The module receives a single input vector composed of {num_vectors}\n")
+    w(f"// concatenated {bit_length}-bit vectors (total of {num_vectors * bit_length} bits) and returns a {bit_length}-bit output\n")
+    w("// representing their bitwise XOR.                                                \n")
+    w("//                                                                                 \n")
+    w("// INPUT:                                                                          \n")
+    w(f"//     - in_vectors : {num_vectors * bit_length}-bit input vector ({num_vectors} concatenated {bit_length}-bit binary vectors)\n")
+    w("//                                                                                 \n")
+    w("// OUTPUT:                                                                         \n")
+    w(f"//     - out_xor    : {bit_length}-bit output vector (bitwise XOR of all {num_vectors} input vectors)\n")
+    w(SRC_HEADER_NOTE_REDUCE if reduce else SRC_HEADER_NOTE)
 
     # Module declaration
-    lines.append(f"module xor_tree_{num_vectors}_{bit_length} (")
-    lines.append(f"    input  wire [{num_vectors * bit_length}-1:0] in_vectors,")
-    lines.append(f"    output wire [{bit_length}-1:0] out_xor")
-    lines.append(");")
-    lines.append("")
-
-    # Unpack input
-    lines.append("    // Unpack input vectors")
-    for i in range(num_vectors):
-        begin_idx = i * bit_length
-        end_idx = (i+1) * bit_length - 1
-        # Declaration
-        lines.append(f"    wire [{bit_length}-1:0] vec_{0}_{i};")
-        # Assignment
-        lines.append(f"    assign vec_{0}_{i} = in_vectors[{end_idx}:{begin_idx}];")
-    lines.append("")
+    w(f"module xor_tree_{num_vectors}_{bit_length} (\n")
+    w(f"    input  wire [{num_vectors * bit_length}-1:0] in_vectors,\n")
+    w(f"    output wire [{bit_length}-1:0] out_xor\n")
+    w(");\n")
+    w("\n")
+
+    # Unpack input (declaration and assignment of each vector)
+    w("    // Unpack input vectors\n")
+    unpack = UNPACK_TEMPLATE.format(bit_length=bit_length)
+    w("".join([
+        unpack % (i, i, (i+1) * bit_length - 1, i * bit_length)
+        for i in range(num_vectors)
+    ]))
+    w("\n")
+
+    if reduce:
+        # Single XOR expression (bitwise, unlike the unary reduction ^{...}, which gives 1 bit)
+        w("    // Assign output\n")
+        w("    assign out_xor = " + " ^ ".join([f"vec_0_{i}" for i in range(num_vectors)]) + ";\n")
+        w("endmodule")
+        if out is None:
+            return buf.getvalue()
+        return
 
     # Tree structure
-    lines.append("    // XOR tree structure")
-    current_level = [(0, i) for i in range(num_vectors)]  # List of (stage, index)
-    stage = 1
-
-    while len(current_level) > 1:
-        next_level = []
-        i = 0
-        lines.append(f"    // Tree stage {stage}")
-        while i < len(current_level):
-            if i + 1 < len(current_level):
-                a_stage, a_idx = current_level[i]
-                b_stage, b_idx = current_level[i+1]
-                new_idx = len(next_level)
-                # Declaration
-                lines.append(f"    wire [{bit_length}-1:0] vec_{stage}_{new_idx};")
-                # Assignment
-                lines.append(f"    assign vec_{stage}_{new_idx} = vec_{a_stage}_{a_idx} ^ vec_{b_stage}_{b_idx};")
-                next_level.append((stage, new_idx))
-                i += 2
-            else:
-                # Odd element, just propagate
-                a_stage, a_idx = current_level[i]
-                new_idx = len(next_level)
-                # Declaration
-                lines.append(f"    wire [{bit_length}-1:0] vec_{stage}_{new_idx};")
-                # Assignment
-                lines.append(f"    assign vec_{stage}_{new_idx} = vec_{a_stage}_{a_idx};")
-                next_level.append((stage, new_idx))
-                i += 1
-        lines.append("")
-        current_level = next_level
-        stage += 1
+    # Every stage halves the number of vectors (rounding up): vec_{stage}_{i} is the XOR of
+    # vec_{stage-1}_{2i} and vec_{stage-1}_{2i+1}, or just vec_{stage-1}_{2i} for the odd
+    # element at the end of a stage, so the tree needs ceil(log2(num_vectors)) stages
+    w("    // XOR tree structure\n")
+    count = num_vectors
+    num_stages = (num_vectors - 1).bit_length()
+    for stage in range(1, num_stages + 1):
+        prev = stage - 1
+        w(f"    // Tree stage {stage}\n")
+        # Pairs of the previous stage are XORed (declaration and assignment of each node)
+        xor_node = XOR_NODE_TEMPLATE.format(bit_length=bit_length, stage=stage, prev=prev)
+        w("".join([
+            xor_node % (i, i, 2*i, 2*i + 1)
+            for i in range(count // 2)
+        ]))
+        if count % 2:
+            # Odd element, just propagate
+            i = count // 2
+            w(f"    wire [{bit_length}-1:0] vec_{stage}_{i};\n")
+            w(f"    assign vec_{stage}_{i} = vec_{prev}_{2*i};\n")
+        w("\n")
+        count = (count + 1) // 2
 
     # Final output
-    final_stage, final_idx = current_level[0]
-    lines.append("    // Assign output")
-    lines.append(f"    assign out_xor = vec_{final_stage}_{final_idx};")
-    lines.append("endmodule")
+    w("    // Assign output\n")
+    w(f"    assign out_xor = vec_{num_stages}_0;\n")
+    w("endmodule")
 
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
 
 def generate_random_integers(num_vectors, bit_length, seed=42):
     """
     Generates num_vectors random integers with at most bit_length bits each
+
+    Uses its own seeded random.Random instance, so the global random state is left untouched
     """
-    random.seed(seed)
-    max_val = 2**bit_length - 1
-    return [random.randint(0, max_val) for _ in range(num_vectors)]
+    getrandbits = random.Random(seed).getrandbits
+    return [getrandbits(bit_length) for _ in range(num_vectors)]
 
 def xor_integers(int_list):
     """
@@ -167,12 +240,21 @@ def random_computation_example(num_vectors, bit_length, seed=42):
     return code_input, expected_code_output
 
 def int_list_to_verilog_vector(int_list, bit_length):
-    formated_int_list = [f"{bit_length}'d{v}" for v in int_list]
-    return "{" + " ,".join(formated_int_list) + "}"
+    """
+    Format a list of integers as a Verilog concatenation of bit_length-bit decimal literals
+
+    The literal prefix is put in the join separator, so only str() runs per integer
+    """
+    if not int_list:
+        return "{}"
+    prefix = f"{bit_length}'d"
+    return "{" + prefix + (" ," + prefix).join(map(str, int_list)) + "}"
 
-def generate_tb(num_vectors, bit_length):
+def generate_tb(num_vectors, bit_length, out=None):
     """
     Generate module testbench code
+
+    If out (file-like object) is given, the code is written to it instead of being returned
     """
     # Generate random test
     int_list_code_input, expected_code_output = random_computation_example(num_vectors, bit_length, seed=42)
@@ -180,96 +262,94 @@ def generate_tb(num_vectors, bit_length):
     # Convert integers to verilog input format
     code_input = int_list_to_verilog_vector(int_list_code_input, bit_length)
 
-    lines = []
+    buf = io.StringIO() if out is None else out
+    w = buf.write
 
     # Header
-    lines.append("// ============================================================================== ")
-    lines.append("// Testbench for Binary XOR Tree                                                  ")
-    lines.append("// ------------------------------------------------------------------------------ ")
-    lines.append("// @author      : Davi Moreno                                                     ")
-    lines.append("// @affiliation : Universidade Federal de Pernambuco (UFPE), PPGEE                ")
-    lines.append("//                                                                                 ")
-    lines.append(f"// Testbench file for xor_tree_{num_vectors}_{bit_length}.v                        ")
-    lines.append("//                                                                                 ")
-    lines.append("// FUNCTIONALITY:                                                                  ")
-    lines.append("//     - Instantiates the XOR tree module with parameters:                         ")
-    lines.append(f"//         - Number of input vectors : {num_vectors}                               ")
-    lines.append(f"//         - Bit-length per vector   : {bit_length}                                ")
-    lines.append("//                                                                                 ")
-    lines.append("//     - Applies random input values to the design                                 ")
-    lines.append("//     - Computes the expected XOR result in simulation                            ")
-    lines.append("//     - Compares module output with expected result and reports mismatches        ")
-    lines.append("//                                                                                 ")
-    lines.append("// NOTE:                                                                           ")
-    lines.append("//     - This testbench is self-checking                                           ")
-    lines.append("//     - Simulation ends with a success or failure message                         ")
-    lines.append("// ============================================================================== ")
-    lines.append("")
-
-    lines.append("`timescale 1ns/1ps")
-    lines.append("")
+    w(TB_HEADER)
+    w(f"// Testbench file for xor_tree_{num_vectors}_{bit_length}.v                        \n")
+    w("//                                                                                 \n")
+    w("// FUNCTIONALITY:                                                                  \n")
+    w("//     - Instantiates the XOR tree module with parameters:                         \n")
+    w(f"//         - Number of input vectors : {num_vectors}                               \n")
+    w(f"//         - Bit-length per vector   : {bit_length}                                \n")
+    w(TB_HEADER_NOTE)
+
+    w("`timescale 1ns/1ps\n")
+    w("\n")
 
     # Module declaration
-    lines.append(f"module tb_xor_tree_{num_vectors}_{bit_length};")
-    lines.append("")
+    w(f"module tb_xor_tree_{num_vectors}_{bit_length};\n")
+    w("\n")
 
     # Declare regs and wires
-    lines.append(f"    reg [{num_vectors * bit_length}-1:0] in_vectors;")
-    lines.append(f"    wire [{bit_length}-1:0] out_xor;")
-    lines.append("")
+    w(f"    reg [{num_vectors * bit_length}-1:0] in_vectors;\n")
+    w(f"    wire [{bit_length}-1:0] out_xor;\n")
+    w("\n")
 
     # Device Under Test (DUT) declaration
-    lines.append(f"    xor_tree_{num_vectors}_{bit_length} DUT (")
-    lines.append("        .in_vectors(in_vectors),")
-    lines.append("        .out_xor(out_xor)")
-    lines.append("    );")
-    lines.append("")
+    w(f"    xor_tree_{num_vectors}_{bit_length} DUT (\n")
+    w("        .in_vectors(in_vectors),\n")
+    w("        .out_xor(out_xor)\n")
+    w("    );\n")
+    w("\n")
 
     # Testing
-    lines.append("    initial begin")
-    lines.append("        #10")
-    lines.append(f"        in_vectors = {code_input};")
-    lines.append("")
-    lines.append("        #10")
-    lines.append(f"        if (out_xor == {bit_length}'d{expected_code_output})")
-    lines.append(f"            $display(\"Test Passed --> tb_xor_tree_{num_vectors}_{bit_length}\");")
-    lines.append("        else")
-    lines.append(f"            $display(\"Test Failed --> tb_xor_tree_{num_vectors}_{bit_length}\");")
-    lines.append("")
-    lines.append("        $stop;")
-    lines.append("    end")
-    lines.append("")
-    lines.append("endmodule")
+    w("    initial begin\n")
+    w("        #10\n")
+    w(f"        in_vectors = {code_input};\n")
+    w("\n")
+    w("        #10\n")
+    w(f"        if (out_xor == {bit_length}'d{expected_code_output})\n")
+    w(f"            $display(\"Test Passed --> tb_xor_tree_{num_vectors}_{bit_length}\");\n")
+    w("        else\n")
+    w(f"            $display(\"Test Failed --> tb_xor_tree_{num_vectors}_{bit_length}\");\n")
+    w("\n")
+    w("        $stop;\n")
+    w("    end\n")
+    w("\n")
+    w("endmodule")
     
-    return "\n".join(lines)
+    if out is None:
+        return buf.getvalue()
+
 
+def ensure_dir(path):
+    """
+    Create directory path (and its parents) if needed
+    Directories already created by this process only cost a single isdir check
+    """
+    path = Path(path)
+    if path in CREATED_DIRS and path.is_dir():
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    CREATED_DIRS.add(path)
 
-def generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir):
+def generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir, reduce=False):
     """
     Generate verilog and testbench files and save them inside save_dir
+    If reduce is True, the module XORs its inputs in a single expression (see generate_src)
     """
     # Create directory to put src and tb files
-    src_dir = save_dir + "/src"
-    tb_dir = save_dir + "/tb"
-    os.makedirs(src_dir, exist_ok=True)
-    os.makedirs(tb_dir, exist_ok=True)
+    src_dir = Path(save_dir) / "src"
+    tb_dir = Path(save_dir) / "tb"
+    ensure_dir(src_dir)
+    ensure_dir(tb_dir)
 
     # Set files path
     out_filename = f"xor_tree_{num_vectors}_{bit_length}.v"
     out_tb_filename = "tb_" + out_filename
-    path_out_filename = src_dir + "/" + out_filename
-    path_out_tb_filename = tb_dir + "/" + out_tb_filename
+    path_out_filename = src_dir / out_filename
+    path_out_tb_filename = tb_dir / out_tb_filename
 
-    # Generate and save verilog code
-    verilog_code = generate_src(num_vectors, bit_length)
-    with open(path_out_filename, "w") as f:
-        f.write(verilog_code)
+    # Generate verilog code straight into the file
+    with open(path_out_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_src(num_vectors, bit_length, reduce=reduce, out=f)
     print(f"Verilog generated in {path_out_filename}")
 
-    # Generate and save tb files
-    verilog_tb_code = generate_tb(num_vectors, bit_length)
-    with open(path_out_tb_filename, "w") as f:
-        f.write(verilog_tb_code)
+    # Generate tb code straight into the file
+    with open(path_out_tb_filename, "w", encoding=WRITE_ENCODING, buffering=WRITE_BUFFER_SIZE) as f:
+        generate_tb(num_vectors, bit_length, out=f)
     print(f"Verilog testbench generated in {path_out_tb_filename}")
 
 def positive_int(value):
@@ -296,6 +376,7 @@ def argument_parser():
     parser.add_argument("num_vectors", type=positive_int, help="Number of input vectors (positive integer)")
     parser.add_argument("bit_length", type=positive_int, help="Size of each vector in bits (positive integer)")
     parser.add_argument("-d", "--dir", default=".", help="Directory to save files (default: current directory)")
+    parser.add_argument("--reduce", action="store_true", help="Write the XOR as a single expression instead of an explicit tree of wires (the synthesis tool builds the tree)")
     args = parser.parse_args()
     return args
 
@@ -308,9 +389,10 @@ def main():
     num_vectors = args.num_vectors  # Number of vectors
     bit_length = args.bit_length  # Vector bit length
     save_dir = os.path.abspath(args.dir)  # Get absolute path
+    reduce = args.reduce  # Single XOR expression instead of an explicit tree
 
     # Generate verilog code and testbench and save them to files
-    generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir)
+    generate_verilog_and_tb_to_files(num_vectors, bit_length, save_dir, reduce=reduce)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file